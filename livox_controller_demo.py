@@ -22,6 +22,16 @@ import openpylivox as opl
 # only used for this demo
 import time
 import sys
+import functools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+
+# issue a command to all the sensors at once rather than one sensor after another, the commands
+# mostly wait on network responses from the sensors so threads work well here
+def forAllSensors(command, sensors, *args):
+    with ThreadPoolExecutor(max_workers=len(sensors)) as executor:
+        list(executor.map(command, sensors, *args))
 
 
 # demo operations for a single Livox Sensor
@@ -141,18 +151,16 @@ def singleSensorDemo():
         sensor.saveDataToFile(filePathAndName, secsToWait, duration)
 
         # simulate other operations being performed
-        while True:
-            # 1 + 1 = 2
+        # 1 + 1 = 2
 
-            # time.sleep(3)   #example of time < (duration + secsToWait), therefore early data capture stop
+        # time.sleep(3)   #example of time < (duration + secsToWait), therefore early data capture stop
 
-            # close the output data file, even if duration has not occurred (ideally used when duration = 0)
-            # sensor.closeFile()
-            # break
+        # close the output data file, even if duration has not occurred (ideally used when duration = 0)
+        # sensor.closeFile()
 
-            # exit loop when capturing is complete (*** IMPORTANT: ignores (does not check) sensors with duration set to 0)
-            if sensor.doneCapturing():
-                break
+        # block (without polling) until capturing is complete, a timeout in seconds can also be specified
+        # (*** IMPORTANT: ignores (does not check) sensors with duration set to 0)
+        sensor.doneCapturing(timeout=None)
 
         # NOTE: Any one of the following commands will also close the output data file (if still being written)
 
@@ -204,59 +212,49 @@ def multipleSensorsDemo():
 
         if connected:
             # initial commands for each sensor (no harm if the parameter is not supported by sensor)
-            sensor.setCartesianCS()
-            sensor.setRainFogSuppression(False)
-            sensor.setLidarReturnMode(0)
-            sensor.setIMUdataPush(True)
+            # sent together as one batch, rather than waiting on the sensor's response to each command in turn
+            sensor.batchCommands([("setCartesianCS",), ("setRainFogSuppression", False), ("setLidarReturnMode", 0), ("setIMUdataPush", True)])
 
             # append to sensor objects list
             sensors.append(sensor)
 
+            # data file for the sensor, using the sensor's serial # (known once connected) as the filename
+            # for Mid-100 sensors the filename specified is used for the data from the left sensor
+            # filename_M for the middle sensor, and filename_R for the right sensor
+            filePathAndNames.append(sensor.serialNumber() + ".bin")
+
     # make sure a sensor was found and connected
     if sensors:
         # spin up all the sensors
-        for i in range(0, len(sensors)):
-            sensors[i].lidarSpinUp()
+        forAllSensors(lambda sensor: sensor.lidarSpinUp(), sensors)
 
         # start all their data streams
-        for i in range(0, len(sensors)):
-            sensors[i].dataStart_RT_B()
+        forAllSensors(lambda sensor: sensor.dataStart_RT_B(), sensors)
 
-        # save data from all the sensors to individual data files, using sensor's serial # as filename
-        for i in range(0, len(sensors)):
-            sensors[i].showMessages(False)
-            # for Mid-100 sensors the filename specified is used for the data from the left sensor
-            # filename_M for the middle sensor, and filename_R for the right sensor
-            filename = sensors[i].serialNumber() + ".bin"
-            filePathAndNames.append(filename)
-            sensors[i].resetShowMessages()
-
-            sensors[i].saveDataToFile(filename, 0.0, 5.0)
+        # save data from all the sensors to their individual data files
+        forAllSensors(lambda sensor, filename: sensor.saveDataToFile(filename, 0.0, 5.0), sensors, filePathAndNames)
 
         # simulate other operations being performed
-        while True:
-            # 1 + 1 = 2
+        # 1 + 1 = 2
 
-            # utility function to exit loop when capturing is complete from ALL sensors (*** IMPORTANT: ignores
-            # (does not check) sensors with duration set to 0)
-            if opl.allDoneCapturing(sensors):
-                break
+        # utility function to block (without polling) until capturing is complete from ALL sensors
+        # (*** IMPORTANT: ignores (does not check) sensors with duration set to 0)
+        opl.allDoneCapturing(sensors, timeout=None)
 
         # stop data on all the sensors
-        for i in range(0, len(sensors)):
-            sensors[i].dataStop()
+        forAllSensors(lambda sensor: sensor.dataStop(), sensors)
 
         # spin down all the sensors
-        for i in range(0, len(sensors)):
-            sensors[i].lidarSpinDown()
+        forAllSensors(lambda sensor: sensor.lidarSpinDown(), sensors)
 
-        # disconnect all the sensors and convert binary data files to ASCII-based files
-        for i in range(0, len(sensors)):
-            sensors[i].disconnect()
+        # disconnect all the sensors
+        forAllSensors(lambda sensor: sensor.disconnect(), sensors)
 
-            # convert BINARY point data to LAS file and IMU data (if applicable) to CSV file
-            # no harm done if filePathAndName is an ASCII CSV file, the conversion will be skipped
-            opl.convertBin2LAS(filePathAndNames[i], deleteBin=True)
+        # convert binary data files to ASCII-based files, each file in its own process (conversion is CPU bound)
+        # convert BINARY point data to LAS file and IMU data (if applicable) to CSV file
+        # no harm done if filePathAndName is an ASCII CSV file, the conversion will be skipped
+        with multiprocessing.Pool() as pool:
+            pool.map(functools.partial(opl.convertBin2LAS, deleteBin=True), filePathAndNames)
 
 
 if __name__ == '__main__':
@@ -18,10 +18,283 @@ Change Log:
 """
 
 # Required Import Statements
+import mmap
+import os
 import struct
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 
+# layout of a single data type 0 point (x, y, z in mm as one 3-vector, reflectivity) - 13 bytes, no padding
+_DT0_DTYPE = np.dtype([('xyz', '<i4', (3,)), ('r', 'u1')])
+
+# layout of a single data type 1 point (distance in mm, zenith and azimuth in 0.01 degrees, reflectivity) - 9 bytes
+_DT1_DTYPE = np.dtype([('distance', '<i4'), ('zenith', '<u2'), ('azimuth', '<u2'), ('r', 'u1')])
+
+# layout of a single data type 2 point (x, y, z in mm as one 3-vector, reflectivity, tag) - 14 bytes
+_DT2_DTYPE = np.dtype([('xyz', '<i4', (3,)), ('r', 'u1'), ('tag', 'u1')])
+
+# layout of a single data type 3 point (distance in mm, zenith and azimuth in 0.01 degrees, reflectivity, tag) - 10 bytes
+_DT3_DTYPE = np.dtype([('distance', '<i4'), ('zenith', '<u2'), ('azimuth', '<u2'), ('r', 'u1'), ('tag', 'u1')])
+
+# layout of a single data type 4 point (two returns, each laid out as a data type 2 point) - 28 bytes
+_DT4_DTYPE = np.dtype([('returns', _DT2_DTYPE, (2,))])
+
+# layout of a single data type 5 point (zenith and azimuth in 0.01 degrees, then two returns of distance in mm,
+# reflectivity and tag) - 16 bytes
+_DT5_DTYPE = np.dtype([('zenith', '<u2'), ('azimuth', '<u2'),
+                       ('returns', [('distance', '<i4'), ('r', 'u1'), ('tag', 'u1')], (2,))])
+
+# precompiled little endian formats of the .lvx public header, private header, device info, package header and frame
+# header blocks (the format strings are parsed once here, instead of on every struct.unpack call)
+_S_HEADER = struct.Struct('<16s4cI')
+_S_PRIVATE = struct.Struct('<IB')
+_S_DEVICE = struct.Struct('<16s16s3B6f')
+_S_PKG = struct.Struct('<5BI2B')
+_S_FRAME = struct.Struct('<3q')
+
+# the size (bytes) of the package header (1 + 1 + 1 + 1 + 1 + 4 + 1 + 1 + 8, page 5 of the .lvx documentation) and of
+# the points of a package of each data type (its number of points, pages 5 to 7 of the .lvx documentation, times the
+# point size), a data type 6 package holds a single IMU record
+_PACKAGE_HEADER_SIZE = 19
+_PACKAGE_SIZES = {0: 100 * 13, 1: 100 * 9, 2: 96 * 14, 3: 96 * 10, 4: 48 * 28, 5: 48 * 16, 6: 24}
+
+
+# return number of a data type 0 or 1 point, looked up by its reflectivity (Mid-40/100 special firmwares report the 2nd
+# and 3rd returns with a reflectivity of 200 and 250 respectively)
+_RET_LUT = np.ones(256, dtype=np.uint8)
+_RET_LUT[200] = 2
+_RET_LUT[250] = 3
+
+# number of raw points decoded at a time by each thread, for files with more points than this
+_DECODE_BLOCK_SIZE = 1 << 20
+
+# divisors of the raw X, Y, Z (mm) and of the raw Dist. (mm), Zen. and Azi. (0.01 degrees) that give m and degrees
+_CARTESIAN_DIVISORS = np.array([1000., 1000., 1000.])
+_SPHERICAL_DIVISORS = np.array([1000., 100., 100.])
+
+
+# the data type 0 to 5 decoders below each work on all the raw points of a file at once (a single vectorized pass,
+# rather than numpy calls per package): null points are skipped and the points are split into contiguous fields, the
+# raw coordinates (or spherical observations) are kept as int32 to be scaled on demand
+
+# the points whose X, Y and Z are all non-zero (three comparisons of the strided columns are much faster than a
+# reduction over the last axis)
+def _nonzero_xyz(xyz):
+    return (xyz[..., 0] != 0) & (xyz[..., 1] != 0) & (xyz[..., 2] != 0)
+
+
+# gathers the Dist., Zen. and Azi. of the valid points straight into the columns of a single int32 array (instead of
+# gathering whole records and then stacking their fields)
+def _gather_spherical(records, valid):
+    xyz_raw = np.empty((np.count_nonzero(valid), 3), dtype=np.int32)
+    xyz_raw[:, 0] = records['distance'][valid]
+    xyz_raw[:, 1] = records['zenith'][valid]
+    xyz_raw[:, 2] = records['azimuth'][valid]
+    return xyz_raw
+
+
+# decodes data type 0 points (X, Y, Z, reflect., return num.)
+def _decode_type0(records):
+    # skip the null points (any zero coordinate), each field is gathered straight into its own contiguous array
+    valid = _nonzero_xyz(records['xyz'])
+    xyz_raw = records['xyz'][valid]
+    reflectivity = records['r'][valid]
+    # return num (for Mid-40/100 special firmwares)
+    return_num = _RET_LUT[reflectivity]
+    return {'xyz_raw': xyz_raw, 'reflectivity': reflectivity, 'return_num': return_num, 'tag': None}
+
+
+# decodes data type 1 points (Dist., Zen., Azi., reflect., return num.)
+def _decode_type1(records):
+    # skip the null points (any zero observation)
+    valid = (records['distance'] != 0) & (records['zenith'] != 0) & (records['azimuth'] != 0)
+    xyz_raw = _gather_spherical(records, valid)
+    reflectivity = records['r'][valid]
+    # return num (for Mid-40/100 special firmwares)
+    return_num = _RET_LUT[reflectivity]
+    return {'xyz_raw': xyz_raw, 'reflectivity': reflectivity, 'return_num': return_num, 'tag': None}
+
+
+# decodes data type 2 points (X, Y, Z, reflect., return num., tag info.)
+def _decode_type2(records):
+    # skip the null points (any zero coordinate), each field is gathered straight into its own contiguous array
+    valid = _nonzero_xyz(records['xyz'])
+    xyz_raw = records['xyz'][valid]
+    return_num = np.ones(len(xyz_raw), dtype=np.uint8)
+    return {'xyz_raw': xyz_raw, 'reflectivity': records['r'][valid], 'return_num': return_num,
+            'tag': records['tag'][valid]}
+
+
+# decodes data type 3 points (Dist., Zen., Azi., reflect., return num., tag info.)
+def _decode_type3(records):
+    # skip the null points (any zero observation)
+    valid = (records['distance'] != 0) & (records['zenith'] != 0) & (records['azimuth'] != 0)
+    xyz_raw = _gather_spherical(records, valid)
+    return_num = np.ones(len(xyz_raw), dtype=np.uint8)
+    return {'xyz_raw': xyz_raw, 'reflectivity': records['r'][valid], 'return_num': return_num,
+            'tag': records['tag'][valid]}
+
+
+# decodes data type 4 points (two returns of X, Y, Z, reflect., return num., tag info.)
+def _decode_type4(records):
+    # both returns of every point, one after the other (2N), so that every mask and gather below is one dimensional
+    returns = records['returns'].reshape(-1)
+    # skip the null returns (any zero coordinate), each field is gathered straight into its own contiguous array
+    valid = _nonzero_xyz(returns['xyz'])
+    xyz_raw = returns['xyz'][valid]
+    return_num = np.tile(np.array([1, 2], dtype=np.uint8), len(records))[valid]
+    return {'xyz_raw': xyz_raw, 'reflectivity': returns['r'][valid], 'return_num': return_num,
+            'tag': returns['tag'][valid]}
+
+
+# decodes data type 5 points (two returns of Dist., Zen., Azi., reflect., return num., tag info.)
+def _decode_type5(records):
+    # both returns of every point, one after the other (2N), so that every mask and gather below is one dimensional
+    returns = records['returns'].reshape(-1)
+    # skip the null returns (any zero observation), both returns share the zenith and azimuth of their point
+    direction = (records['zenith'] != 0) & (records['azimuth'] != 0)
+    valid = np.repeat(direction, 2) & (returns['distance'] != 0)
+    xyz_raw = np.empty((np.count_nonzero(valid), 3), dtype=np.int32)
+    xyz_raw[:, 0] = returns['distance'][valid]
+    xyz_raw[:, 1] = np.repeat(records['zenith'], 2)[valid]
+    xyz_raw[:, 2] = np.repeat(records['azimuth'], 2)[valid]
+    return_num = np.tile(np.array([1, 2], dtype=np.uint8), len(records))[valid]
+    return {'xyz_raw': xyz_raw, 'reflectivity': returns['r'][valid], 'return_num': return_num,
+            'tag': returns['tag'][valid]}
+
+
+# joins the raw points of every package read by a data type 0 to 5 reader and decodes them all at once, the divisors
+# scale the raw coordinates (or spherical observations) to m (and degrees). Large files are decoded in blocks by a pool
+# of threads, which run in parallel as numpy releases the GIL during the comparisons and gathers
+def _join_points(packages, recorddtype, decoder, divisors):
+    records = np.frombuffer(b"".join(packages), dtype=recorddtype)
+    if len(records) > _DECODE_BLOCK_SIZE and (os.cpu_count() or 1) > 1:
+        blocks = [records[i:i + _DECODE_BLOCK_SIZE] for i in range(0, len(records), _DECODE_BLOCK_SIZE)]
+        with ThreadPoolExecutor() as executor:
+            decoded = list(executor.map(decoder, blocks))
+        points = {}
+        for field in decoded[0]:
+            if decoded[0][field] is None:
+                points[field] = None
+            else:
+                points[field] = np.concatenate([block[field] for block in decoded])
+    else:
+        points = decoder(records)
+    points['xyz_divisors'] = divisors
+    return points
+
+
+# joins the raw records of every package read by the data type 6 reader into a single array of IMU data
+def _join_imu(packages):
+    return np.frombuffer(b"".join(packages), dtype='<f4').reshape(-1, 6).astype(np.float64)
+
+
+# walks the packages of the given frames (offset and size in bytes) of a memory mapped .lvx file in place: the data type
+# is byte 10 of the package header (see read_package_header) and the points of a package are taken as a single view of
+# the file (see the data_typeN_reader methods), appended to the list of its data type in packages (maps each data type
+# to its list, None to skip its packages, and to the size of its packages' points). Returns the last package's data type
+def _walk_packages(view, frames, packages):
+    datatype = None
+    for offset, framesize in frames:
+        frame = view[offset:offset + framesize]
+        poffset = 0
+        while poffset < framesize:
+            datatype = frame[poffset + 10]
+            poffset += _PACKAGE_HEADER_SIZE
+            if datatype in packages:
+                datatype_points, packagesize = packages[datatype]
+                if datatype_points is not None:
+                    datatype_points.append(frame[poffset:poffset + packagesize])
+                poffset += packagesize
+    return datatype
+
+
+# reads the frame header at offset (bytes) of a memory mapped .lvx file in place, returning the offset just past it
+# and a list of its elements as described in the lvx file documentation (empty at the end of the file)
+def _read_frame_header(mm, offset, frblocksize=24, showmessages=False):
+    # no frame header block left
+    if offset >= len(mm):
+        if showmessages:
+            print("Done with frame reading")
+        return [offset, []]
+    # unpack the values in place using the known data type - little endian, 3 unsigned long long types
+    value4 = list(_S_FRAME.unpack_from(mm, offset))
+    # for debugging:
+    if showmessages:
+        print("Frame Header")
+        print(value4)
+    return [offset + frblocksize, value4]
+
+
+# reads the frame headers of a block of frames from offset (each numbered from frame index 0) up to the end of the file
+# or a frame index that does not match up with the frame count, appending the offset and size (bytes, up to the end of
+# the file) of every frame to frames. The frame bodies are skipped over. Returns the offset past the last frame read,
+# i.e., of the frame header that ended the block (the next block starts at its frame index 0 header)
+def _read_frame_table(mm, offset, frames, showmessages=False):
+    fcounter = 0
+    while True:
+        start = offset
+        offset, fheaderdata = _read_frame_header(mm, offset, _S_FRAME.size)
+        if not fheaderdata or fheaderdata[2] != fcounter:
+            return start
+        fcounter += 1
+        totalbytestoread = fheaderdata[1] - (fheaderdata[0] + _S_FRAME.size)
+        if showmessages:
+            print(totalbytestoread)
+        framesize = max(0, min(totalbytestoread, len(mm) - offset))
+        frames.append((offset, framesize))
+        offset += framesize
+
+
+# reads all packages of the given frames of a memory mapped .lvx file (see _walk_packages) and decodes them all at once,
+# returning the data type of the points, the points (see _join_points) and the IMU data. Only the first data type with
+# points is returned (or the wanted one), so the data types after it are not decoded (None and None without points)
+def _decode_frames(view, frames, wanted=None, showmessages=False):
+    # the list each data type's packages' points are collected in (None for the point data types that are not wanted,
+    # their packages are only stepped over), and the size of its packages' points
+    packages = {datatype: ([] if wanted is None or datatype in (wanted, 6) else None, packagesize)
+                for datatype, packagesize in _PACKAGE_SIZES.items()}
+    try:
+        datatype = _walk_packages(view, frames, packages)
+        if datatype != 6:
+            if showmessages:
+                print('Data type', datatype)
+        imudata = _join_imu(packages[6][0])
+        for datatype, (recorddtype, decoder, divisors) in _POINT_DECODERS.items():
+            # only the data types seen in the file (with collected packages) are joined and decoded
+            if not packages[datatype][0]:
+                continue
+            points = _join_points(packages[datatype][0], recorddtype, decoder, divisors)
+            if len(points['xyz_raw']) != 0:
+                return datatype, points, imudata
+        return None, None, imudata
+    finally:
+        for datatype_points, packagesize in packages.values():
+            if datatype_points is not None:
+                datatype_points.clear()
+
+
+# the point data types in the order they are looked for in a file, each with its record dtype, its decoder and the
+# divisors of its raw coordinates (or spherical observations)
+_POINT_DECODERS = {0: (_DT0_DTYPE, _decode_type0, _CARTESIAN_DIVISORS),
+                   1: (_DT1_DTYPE, _decode_type1, _SPHERICAL_DIVISORS),
+                   2: (_DT2_DTYPE, _decode_type2, _CARTESIAN_DIVISORS),
+                   3: (_DT3_DTYPE, _decode_type3, _SPHERICAL_DIVISORS),
+                   4: (_DT4_DTYPE, _decode_type4, _CARTESIAN_DIVISORS),
+                   5: (_DT5_DTYPE, _decode_type5, _SPHERICAL_DIVISORS)}
+
+
+# reads a data type 0 to 5 package's points at offset (bytes) of a frame: the points are taken as a single view of the
+# frame and appended to datatype_points (to be decoded with every other package, see _join_points). Returns the offset
+# just past the package, this package's points decoded on their own (see _decode_type0 to _decode_type5) and
+# datatype_points
+def _read_points_package(buf, offset, datatype, datatype_points):
+    recorddtype, decoder, divisors = _POINT_DECODERS[datatype]
+    package = buf[offset:offset + _PACKAGE_SIZES[datatype]]
+    datatype_points.append(package)
+    return [offset + len(package), decoder(np.frombuffer(package, dtype=recorddtype)), datatype_points]
+
 
 class BinaryReaders:
     '''
@@ -30,8 +303,17 @@ class BinaryReaders:
     '''
 
     def __init__(self, datapoints, imudata, datatype=None):
+        # the points are stored per field, each a contiguous numpy array: xyz_raw (X, Y, Z or Dist., Zen., Azi. as read,
+        # int32 for points read from a file) with its per column xyz_divisors, reflectivity, return_num and tag (None for
+        # data types 0 and 1)
         if datapoints is None:
             self.datapoints = []
+        elif isinstance(datapoints, dict):
+            self.xyz_raw = datapoints['xyz_raw']
+            self.xyz_divisors = datapoints['xyz_divisors']
+            self.reflectivity = datapoints['reflectivity']
+            self.return_num = datapoints['return_num']
+            self.tag = datapoints['tag']
         else:
             self.datapoints = datapoints
         if imudata is None:
@@ -41,6 +323,62 @@ class BinaryReaders:
 
         self.datatype = datatype
 
+    @property
+    def xyz(self):
+        '''
+        The X, Y, Z (m) or Dist. (m), Zen. and Azi. (degrees) of the points, scaled from the raw values in a single
+        vectorized operation on every access.
+        '''
+        return self.xyz_raw / self.xyz_divisors
+
+    @property
+    def datapoints(self):
+        '''
+        The points as a single numpy array with one row per point (X, Y, Z or Dist., Zen., Azi., reflect., return num.
+        and tag info. if present). The array is assembled from the per field arrays on every access, so keep a reference
+        to it rather than accessing it repeatedly.
+        '''
+        columns = [self.xyz, self.reflectivity, self.return_num]
+        if self.tag is not None:
+            columns.append(self.tag)
+        return np.column_stack(columns)
+
+    @datapoints.setter
+    def datapoints(self, datapoints):
+        datapoints = np.asarray(datapoints, dtype=np.float64)
+        if datapoints.size == 0:
+            datapoints = np.empty((0, 5))
+        self.xyz_raw = datapoints[:, 0:3].copy()
+        self.xyz_divisors = np.ones(3)
+        self.reflectivity = datapoints[:, 3].astype(np.uint8)
+        self.return_num = datapoints[:, 4].astype(np.uint8)
+        self.tag = datapoints[:, 5].astype(np.uint8) if datapoints.shape[1] > 5 else None
+
+    def to_cartesian(self):
+        '''
+        The X, Y, Z (m) of the points. The Dist., Zen. and Azi. of the spherical data types (1, 3 and 5) are converted
+        (x = d sin(zen) cos(azi), y = d sin(zen) sin(azi), z = d cos(zen)) in vectorized passes over whole arrays, the
+        points of the other data types are only scaled. Computed on every call, so keep a reference to the result.
+        '''
+        if self.datatype not in (1, 3, 5):
+            return self.xyz
+        spherical = self.xyz
+        distance = spherical[:, 0]
+        zenith = np.radians(spherical[:, 1])
+        azimuth = np.radians(spherical[:, 2])
+
+        xyz = np.empty_like(spherical)
+        np.cos(zenith, out=xyz[:, 2])
+        xyz[:, 2] *= distance
+        # the horizontal distance, in place of the zenith
+        np.sin(zenith, out=zenith)
+        zenith *= distance
+        np.cos(azimuth, out=xyz[:, 0])
+        xyz[:, 0] *= zenith
+        np.sin(azimuth, out=xyz[:, 1])
+        xyz[:, 1] *= zenith
+        return xyz
+
 
     @staticmethod
     def simplecloudreader(pathtofile, showmessages=False):
@@ -69,9 +407,6 @@ class BinaryReaders:
 
         '''
 
-        # How many blocks have we gone through (keep track of our progress through the file)
-        counter = 0
-
         # The size (in bytes) of the public header block
         headersize = 27
         # The size (in bytes) of the subsequent data blocks
@@ -86,553 +421,312 @@ class BinaryReaders:
         # format string
         hblockfms = '<9s6s6s6s'
 
-        # Format character string for the data block buffer
-        dblockfms = '<iddd'
-
         # Open the binary file with the open statement and the flag 'rb' as f. 'r' in 'rb' indicates the file should be
         # opened as read only and 'b' in 'rb' indicates the file should be opened as a binary file
         with open(pathtofile, 'rb') as f:
-            # While I can still read data from the file
-            while True:
-                # If we're reading in the first block (the header block)
-                if counter < 1:
-                    # read in a block of size headersize
-                    buffer = f.read(headersize)
-
-                    # If the buffer returns nothing, stop reading the file
-                    if not buffer:
-                        break
-                    # unpack the binary data in the buffer using the format string hblockfms
-                    header = struct.unpack(hblockfms, buffer)
-                    # decode the entries in the header block to the 'utf-8' format
-                    header1 = header[0].decode('utf-8')
-                    header2 = header[1].decode('utf-8')
-                    header3 = header[2].decode('utf-8')
-                    header4 = header[3].decode('utf-8')
-                    if showmessages:
-                        print("The header values are:", header1, header2, header3, header4)
-
-                    # Create a numpy.void array for holding our values
-                    # first define the field 'names' for the numpy array which were read in from the header block,
-                    # and the data types of each column of the numpy array (known beforehand from the PDF)
-                    dt = {'names': [header1, header2, header3, header4],
-                          'formats': [np.int64, np.double, np.double, np.double]}
-
-                    # Now actually create the array
-                    # We've initialized it as an array of 4 zeros, and will append in the elif statements
-                    # Specifically it is one row (hence the 1 in the statement below) of 4 zeros with each column of
-                    # that row having the datatype specified by dt above
-                    pointcloud = np.zeros(1, dtype=dt)
-                    if showmessages:
-                        print("The pointcloud array looks like:")
-                        print(pointcloud)
-                    # How could this statement be written more pythonically? Google increment/decrement operators in
-                    # python
-                    counter += 1
-                # If we're reading in the first block of data (data blocks)
-                elif counter == 1:
-                    # Read in the numerical data from the buffer of size datablocksize
-                    buffer = f.read(datablocksize)
-
-                    # If the buffer returns nothing, stop reading the file (shouldn't happen)
-                    if not buffer:
-                        break
-                    # Unpack the numerical data in the buffer using the formatstring dblockfms
-                    # Because the data is numeric, we don't need to do any decoding
-                    datablock = struct.unpack(dblockfms, buffer)
-                    dblock1 = datablock[0]
-                    dblock2 = datablock[1]
-                    dblock3 = datablock[2]
-                    dblock4 = datablock[3]
-
-                    # throw the first value (the integer) from the first datablock that we're reading into
-                    # the first entry (0) of the column with the label header1
-                    pointcloud[header1][0] = dblock1
-                    # throw the second value (the x coordinate double) from the first datablock that we're reading into
-                    # the first entry (0) of the column with the label header2
-                    pointcloud[header2][0] = dblock2
-                    # throw the third value (the y coordinate double) from the first datablock that we're reading into
-                    # the first entry (0) of the column with the label header3
-                    pointcloud[header3][0] = dblock3
-                    # throw the fourth value (the z coordinate double) from the first datablock that we're reading into
-                    # the first entry (0) of the column with the label header4
-                    pointcloud[header4][0] = dblock4
-
-                    # increment our counter as we read through the blocks of binary data
-                    counter = counter + 1
-
-                # If we're reading any subsequent blocks of binary data, let's just append the data to our numpy array
-                elif counter > 1:
-                    # Read in the data from the buffer as in the previous elif statement
-                    buffer = f.read(datablocksize)
-
-                    # If the buffer returns nothing, stop reading the file
-                    if not buffer:
-                        break
+            # The number of data blocks in the file (known from the file size)
+            numblocks = max((os.fstat(f.fileno()).st_size - headersize) // datablocksize, 0)
+
+            # read in the header block, of size headersize
+            buffer = f.read(headersize)
+            # unpack the binary data in the buffer using the format string hblockfms
+            header = struct.unpack(hblockfms, buffer)
+            # decode the entries in the header block to the 'utf-8' format
+            header1 = header[0].decode('utf-8')
+            header2 = header[1].decode('utf-8')
+            header3 = header[2].decode('utf-8')
+            header4 = header[3].decode('utf-8')
+            if showmessages:
+                print("The header values are:", header1, header2, header3, header4)
+
+            # Layout of the data blocks in the file: a 4 byte int point number at byte 0, then the x, y and z coordinate
+            # doubles at bytes 4, 12 and 20 (packed, 28 bytes in total)
+            blockdt = {'names': [header1, header2, header3, header4],
+                       'formats': ['<i4', '<f8', '<f8', '<f8'],
+                       'offsets': [0, 4, 12, 20],
+                       'itemsize': datablocksize}
+
+            # Read in all the data blocks at once and view them as a numpy array with the layout above (no per block
+            # unpacking)
+            datablocks = np.frombuffer(f.read(numblocks * datablocksize), dtype=blockdt, count=numblocks)
+
+        # Create a numpy.void array for holding our values
+        # first define the field 'names' for the numpy array which were read in from the header block,
+        # and the data types of each column of the numpy array (known beforehand from the PDF)
+        dt = {'names': [header1, header2, header3, header4],
+              'formats': [np.int64, np.double, np.double, np.double]}
+
+        # Now actually create the array, with one row per data block (at least one row, of zeros, if there are no data
+        # blocks) and each column of the rows having the datatype specified by dt above
+        pointcloud = np.zeros(max(numblocks, 1), dtype=dt)
+        # then copy all the data blocks into it, column by column
+        for name in dt['names']:
+            pointcloud[name][:numblocks] = datablocks[name]
+        if showmessages:
+            print("The pointcloud array looks like:")
+            print(pointcloud)
 
-                    # unpack everything as before
-                    datablock = struct.unpack(dblockfms, buffer)
-                    dblock1 = datablock[0]
-                    dblock2 = datablock[1]
-                    dblock3 = datablock[2]
-                    dblock4 = datablock[3]
+        # return the 4 column numpy array with field names that were read in from the public header block
+        return pointcloud
 
-                    # Put these 4 entries into a little numpy array with the same datatypes as declared in the first if
-                    # statement
-                    temp = np.array((dblock1, dblock2, dblock3, dblock4), dtype=dt)
+    @staticmethod
+    def read_package_header(buf, offset, packagedatasize=19, showmessages=False):
+        '''
+        A method for reading package headers
 
-                    # Append the temporary array to the pointcloud array accordingly:
-                    pointcloud = np.append(pointcloud, temp)
+        Parameters
+        ----------
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            offset (bytes) of this package header within the frame
+        packagedatasize : int
+            Size of the package "header" in bytes
 
-                    # Increment the counter
-                    counter = counter + 1
+        Returns
+        -------
+        offset : int
+            offset (bytes) within the frame just past this package header
+        data type: int
+            the data type of points in the package
 
-        # return the 4 column numpy array with field names that were read in from the public header block
-        return pointcloud
+        '''
+        # unpack the block as little endian with data types from .lvx documentation
+        value7 = _S_PKG.unpack_from(buf, offset)
+        if showmessages:
+            #the timestamp - 8 bytes
+            buf7b = buf[offset + _S_PKG.size:offset + packagedatasize]
+            #decoding the timestamp specific for Timestamp Type 0 -- dtype differs for each timestamp type, see livox documentation
+            print(int.from_bytes(buf7b, 'little'))
+            print("Package")
+            print(list(value7))
+        # We know that value7[7] (per the Livox lvx documentation - see the table on page 8)
+        # contains the data type that is going to be read
+        datatype = value7[7]
+        return [offset + packagedatasize, datatype]
 
     @staticmethod
-    def data_type0_reader(fobj, totalbytesread, datatype_points, datasize_0=13, showmessages=False):
-        '''
-                A method for reading in data type 0 points
-
-                Parameters
-                ----------
-                fobj : BinaryIO
-                    File object for the .lvx file being read
-                totalbytesread : int
-                    The total bytes read by the file reader up to this package
-                datatype_points : list
-                    list containing all points of data type 0 in the entire file
-                datasize_0 : int
-                    Size of the type 0 points data type (page 5 .lvx documentation)
-
-                Returns
-                -------
-                totalbytesread : int
-                    Number of bytes read in the file including this package
-                points_type_0 : list
-                    A python list of all 100 points in this data type 0 package
-                datatype_points : list
-                    list containing all points of data type 0 in the entire file (read so far)
-
-                '''
-        newcounter = 1
+    def data_type0_reader(buf, offset, datatype_points, datasize_0=13, showmessages=False):
+        '''
+        A method for reading in data type 0 points
+
+        Parameters
+        ----------
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
+        datatype_points : list
+            list of the raw points (one memoryview per package) containing all points of data type 0 in the entire file
+        datasize_0 : int
+            Size of the type 0 points data type (page 5 .lvx documentation), the points are laid out as _DT0_DTYPE
+
+        Returns
+        -------
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_0 : dict
+            All 100 points of this data type 0 package, decoded by _decode_type0 (null points skipped)
+        datatype_points : list
+            list of the raw points (one memoryview per package) containing all points of data type 0 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
+
+        '''
         if showmessages:
             print("Type 0 points being read...")
-        # create empty list
-        points_type_0 = [];
-        while newcounter <= 100:
-            # print("Point", newcounter)
-            buf6 = fobj.read(datasize_0)
-            value6 = struct.unpack('<iiiB', buf6)
-            # add values to list
-            points_type_0.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                # X, Y, Z, reflect., return num.
-                pt = [0, 0, 0, 0, 0]
-                pt[0] = value6[0] / 1000.
-                pt[1] = value6[1] / 1000.
-                pt[2] = value6[2] / 1000.
-                pt[3] = value6[3]
-                #return num (for Mid-40/100 special firmwares)
-                pt[4] = 1
-                if pt[3] == 200:
-                    pt[4] = 2
-                elif pt[3] == 250:
-                    pt[4] = 3
-                datatype_points.append(pt)
-            # increment counter
-            newcounter = newcounter + 1
-            # add to total amount of bytes read
-            totalbytesread += datasize_0
-        # print the type 1 points in this package
-        # print(points_type_0)
-
-        return [totalbytesread, points_type_0, datatype_points]
+        return _read_points_package(buf, offset, 0, datatype_points)
 
     @staticmethod
-    def data_type1_reader(fobj, totalbytesread, datatype_points, datasize_1=9, showmessages=False):
+    def data_type1_reader(buf, offset, datatype_points, datasize_1=9, showmessages=False):
         '''
         A method for reading in data type 1 points
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            a python list containing all points of data type 1 in the entire file
+            list of the raw points (one memoryview per package) containing all points of data type 1 in the entire file
         datasize_1 : int
-            Size of the type 1 points data type (page 6 .lvx documentation)
+            Size of the type 1 points data type (page 6 .lvx documentation), the points are laid out as _DT1_DTYPE
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_1 : list of tuples
-            A python list of all 100 points in this data type 1 package
-            - we know 100 points per package of data type 1 from lvx documentation page 6
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_1 : dict
+            All 100 points of this data type 1 package, decoded by _decode_type1 (null points skipped)
         datatype_points : list
-            list containing all points of data type 1 in the file (read so far)
+            list of the raw points (one memoryview per package) containing all points of data type 1 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
 
         '''
-        newcounter2 = 1
         if showmessages:
             print("Type 1 points being read...")
-        # create empty list
-        points_type_1 = []
-        while newcounter2 <= 100:
-            # print("Point", newcounter2)
-            buf6 = fobj.read(datasize_1)
-            value6 = struct.unpack('<iHHB', buf6)
-            # add values to list
-            points_type_1.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                # Dist., Zen., Azi, reflect., return num.
-                pt = [0, 0, 0, 0, 0]
-                pt[0] = value6[0] / 1000.
-                pt[1] = value6[1] / 100.
-                pt[2] = value6[2] / 100.
-                pt[3] = value6[3]
-                # return num (for Mid-40/100 special firmwares)
-                pt[4] = 1
-                if pt[3] == 200:
-                    pt[4] = 2
-                elif pt[3] == 250:
-                    pt[4] = 3
-                datatype_points.append(pt)
-            # increment counter
-            newcounter2 = newcounter2 + 1
-            # add to total amount of bytes read
-            totalbytesread += datasize_1
-        # print the type 1 points in this package
-        # print(points_type_1)
-
-        return [totalbytesread, points_type_1, datatype_points]
+        return _read_points_package(buf, offset, 1, datatype_points)
 
     @staticmethod
-    def data_type2_reader(fobj, totalbytesread, datatype_points, datasize_2=14, showmessages=False):
+    def data_type2_reader(buf, offset, datatype_points, datasize_2=14, showmessages=False):
         '''
         A method for reading in data type 2 points
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            list containing all points of data type 2 in the entire file
+            list of the raw points (one memoryview per package) containing all points of data type 2 in the entire file
         datasize_2 : int
-            Size of the type 2 points data type (page 6 .lvx documentation)
+            Size of the type 2 points data type (page 6 .lvx documentation), the points are laid out as _DT2_DTYPE
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_2 : list
-            A python list of all 96 points in this
-            data type 2 package
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_2 : dict
+            All 96 points of this data type 2 package, decoded by _decode_type2 (null points skipped)
         datatype_points : list
-            list containing all points of data type 2 in the entire file (read so far)
+            list of the raw points (one memoryview per package) containing all points of data type 2 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
 
         '''
-        newcounter2 = 1
         if showmessages:
             print("Type 2 points being read...")
-
-        # create empty list
-        points_type_2 = []
-        while newcounter2 <= 96:
-            # print("Point", newcounter2)
-            buf6 = fobj.read(datasize_2)
-            value6 = struct.unpack('<3i2B', buf6)
-            # add values to list
-            points_type_2.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                # X, Y, Z, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[0] / 1000.
-                pt[1] = value6[1] / 1000.
-                pt[2] = value6[2] / 1000.
-                pt[3] = value6[3]
-                pt[4] = 1           #return number
-                pt[5] = value6[4]   #tag information
-                datatype_points.append(pt)
-            # increment counter
-            newcounter2 = newcounter2 + 1
-            # add to total amount of bytes read
-            totalbytesread += datasize_2
-        # print the type 2 points in this package
-        # print(points_type_2)
-
-        return [totalbytesread, points_type_2, datatype_points]
+        return _read_points_package(buf, offset, 2, datatype_points)
 
     @staticmethod
-    def data_type3_reader(fobj, totalbytesread, datatype_points, datasize_3=10, showmessages=False):
+    def data_type3_reader(buf, offset, datatype_points, datasize_3=10, showmessages=False):
         '''
         A method for reading in data type 3 points
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            list containing all points of data type 3 in the file
+            list of the raw points (one memoryview per package) containing all points of data type 3 in the entire file
         datasize_3 : int
-            Size of the type 3 points data type (page 6 .lvx documentation)
+            Size of the type 3 points data type (page 6 .lvx documentation), the points are laid out as _DT3_DTYPE
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_3 : list
-            A python list of all 96 points in this data type 3 package
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_3 : dict
+            All 96 points of this data type 3 package, decoded by _decode_type3 (null points skipped)
         datatype_points : list
-            A list of all points of data type 3 in the entire file (read so far)
+            list of the raw points (one memoryview per package) containing all points of data type 3 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
 
         '''
-        newcounter2 = 1
         if showmessages:
             print("Type 3 points being read...")
-        # create empty list
-        points_type_3 = []
-        while newcounter2 <= 96:
-            # print("Point", newcounter2)
-            buf6 = fobj.read(datasize_3)
-            value6 = struct.unpack('<iHHBB', buf6)
-            # add values to list
-            points_type_3.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                # Dist., Zen., Azi, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[0] / 1000.
-                pt[1] = value6[1] / 100.
-                pt[2] = value6[2] / 100.
-                pt[3] = value6[3]
-                pt[4] = 1  # return number
-                pt[5] = value6[4]  # tag information
-                datatype_points.append(pt)
-            # increment counter
-            newcounter2 = newcounter2 + 1
-            # add to total amount of bytes read
-            totalbytesread += datasize_3
-        # print the type 3 points in this package
-        # print(points_type_3)
-
-        return [totalbytesread, points_type_3, datatype_points]
+        return _read_points_package(buf, offset, 3, datatype_points)
 
     @staticmethod
-    def data_type4_reader(fobj, totalbytesread, datatype_points, datasize_4=28, showmessages=False):
+    def data_type4_reader(buf, offset, datatype_points, datasize_4=28, showmessages=False):
         '''
         A method for reading in data type 4 points
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            list containing all points of data type 4 in the entire file
+            list of the raw points (one memoryview per package) containing all points of data type 4 in the entire file
         datasize_4 : int
-            Size of the type 4 points data type (page 6 .lvx documentation)
+            Size of the type 4 points data type (page 6 .lvx documentation), the points are laid out as _DT4_DTYPE
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_4 : list
-            A python list of all 48 points in this data type 4 package
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_4 : dict
+            All 48 points of this data type 4 package, decoded by _decode_type4 (null points skipped)
         datatype_points : list
-            A list of all data type 4 points in the file (read so far)
+            list of the raw points (one memoryview per package) containing all points of data type 4 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
 
         '''
-        newcounter2 = 1
         if showmessages:
             print("Type 4 points being read...")
-        # create empty list
-        points_type_4 = []
-        while newcounter2 <= 48:
-            # print("Point", newcounter2)
-            buf6 = fobj.read(datasize_4)
-            value6 = struct.unpack('<iiiBBiiiBB', buf6)
-            # add values to list
-            points_type_4.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                #X, Y, Z, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[0] / 1000.
-                pt[1] = value6[1] / 1000.
-                pt[2] = value6[2] / 1000.
-                pt[3] = value6[3]
-                pt[4] = 1
-                pt[5] = value6[4]
-                datatype_points.append(pt)
-            if (value6[5] != 0 and value6[6] != 0 and value6[7] != 0):
-                #X, Y, Z, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[5] / 1000.
-                pt[1] = value6[6] / 1000.
-                pt[2] = value6[7] / 1000.
-                pt[3] = value6[8]
-                pt[4] = 2
-                pt[5] = value6[9]
-                datatype_points.append(pt)
-            # increment counter
-            newcounter2 = newcounter2 + 1
-            # add to total amount of bytes read
-            totalbytesread += datasize_4
-        # print the type 4 points in this package
-        # print(points_type_4)
-
-        return [totalbytesread, points_type_4, datatype_points]
+        return _read_points_package(buf, offset, 4, datatype_points)
 
     @staticmethod
-    def data_type5_reader(fobj, totalbytesread, datatype_points, datasize_5=16, showmessages=False):
+    def data_type5_reader(buf, offset, datatype_points, datasize_5=16, showmessages=False):
         '''
         A method for reading in data type 5 points
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            list containing all points of data type 5 in the entire file
+            list of the raw points (one memoryview per package) containing all points of data type 5 in the entire file
         datasize_5 : int
-            Size of the type 5 points data type (page 7 .lvx documentation)
+            Size of the type 5 points data type (page 7 .lvx documentation), the points are laid out as _DT5_DTYPE
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_5 : list
-            A python list of all 48 points in this data type 5 package
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_5 : dict
+            All 48 points of this data type 5 package, decoded by _decode_type5 (null points skipped)
         datatype_points : list
-            A list of all data type 5 points in the file (read so far)
+            list of the raw points (one memoryview per package) containing all points of data type 5 in the entire file
+            (read so far), to be decoded all at once (see _join_points)
 
         '''
-        newcounter2 = 1
         if showmessages:
             print("Type 5 points being read...")
-        points_type_5 = []
-        while newcounter2 <= 48:
-            # print("Point", newcounter2)
-            buf6 = fobj.read(datasize_5)
-            value6 = struct.unpack('<HHiBBiBB', buf6)
-            # add values to list
-            points_type_5.append(value6)
-            if (value6[0] != 0 and value6[1] != 0 and value6[2] != 0):
-                # Dist., Zen., Azi, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[2] / 1000.
-                pt[1] = value6[0] / 100.
-                pt[2] = value6[1] / 100.
-                pt[3] = value6[3]
-                pt[4] = 1
-                pt[5] = value6[4]
-                datatype_points.append(pt)
-            if (value6[0] != 0 and value6[1] != 0 and value6[5] != 0):
-                # Dist., Zen., Azi, reflect., return num., tag info.
-                pt = [0, 0, 0, 0, 0, 0]
-                pt[0] = value6[5] / 1000.
-                pt[1] = value6[0] / 100.
-                pt[2] = value6[1] / 100.
-                pt[3] = value6[6]
-                pt[4] = 2
-                pt[5] = value6[7]
-                datatype_points.append(pt)
-            newcounter2 = newcounter2 + 1
-            totalbytesread += datasize_5
-        # print the type 5 points in this package
-        # print(points_type_5)
-
-        return [totalbytesread, points_type_5, datatype_points]
+        return _read_points_package(buf, offset, 5, datatype_points)
 
     @staticmethod
-    def data_type6_reader(fobj, totalbytesread, datatype_points, datasize_6=24, showmessages=False):
+    def data_type6_reader(buf, offset, datatype_points, datasize_6=24, showmessages=False):
         '''
         A method for reading in data type 6 points (IMU data)
 
         Parameters
         ----------
-        fobj : BinaryIO
-            File object for the .lvx file being read
-        totalbytesread : int
-            The total bytes read by the file reader up to this package
+        buf : memoryview
+            The frame of the .lvx file being read
+        offset : int
+            Offset (bytes) of this package's points within the frame
         datatype_points : list
-            list containing all points of data type 6 in the entire file
+            list of the raw records (one memoryview per package) containing all points of data type 6 in the entire file
         datasize_6 : int
             Size of the type 6 points data type (page 7 .lvx documentation)
 
         Returns
         -------
-        totalbytesread : int
-            Number of bytes read in the file including this package
-        points_type_6 : list
-            A python list (or you can choose another data type - np.ndarray would also work) of the single points in this
+        offset : int
+            Offset (bytes) within the frame just past this package
+        points_type_6 : numpy.ndarray
+            A numpy array of the single point in this
             data type 6 package - page 7 of documentation says that type 6 data only have one point per package
         datatype_points: list
-            A list of all data type 6 points in the file
+            A list of the raw records (one memoryview per package) of all data type 6 points in the file (see _join_imu)
 
         '''
-        # load the type 6 data block into buffer
-        buf31 = fobj.read(datasize_6)
-        # unpack it, little endian 6 floating point numbers
-        value31 = struct.unpack('<6f', buf31)
+        # take the type 6 data block, little endian 6 floating point numbers
+        buf31 = buf[offset:offset + _PACKAGE_SIZES[6]]
+        points_type_6 = _join_imu([buf31])[0]
         # debug print statements
         if showmessages:
             print("IMU")
-        points_type_6 = list(value31)
-        if showmessages:
             print(points_type_6)
-        datatype_points.append(points_type_6)
-        totalbytesread += datasize_6
-        return [totalbytesread, points_type_6, datatype_points]
-
-    @staticmethod
-    def read_package_header(fobj, totalbytesread, packagedatasize=19, showmessages=False):
-        '''
-        A method for reading package headers
-
-        Parameters
-        ----------
-        fobj : BinaryIO
-            File object of the .lvx file being read
-        totalbytesread : int
-            number of bytes read in the file up to this package header
-        packagedatasize : int
-            Size of the package "header" in bytes
-
-        Returns
-        -------
-        totalbytesread : int
-            number of bytes read in the file including this package header
-        data type: int
-            the data type of points in the package
-
-        '''
-        # read in the block to the buffer
-        buf7 = fobj.read(11)
-        #reading in the timestamp - 8 bytes
-        buf7b = fobj.read(8)
-        # unpack the block as little endian with data types from .lvx documentation
-        value7 = struct.unpack('<5BI2B', buf7)
-        #decoding the timestamp specific for Timestamp Type 0 -- dtype differs for each timestamp type, see livox documentation
-        print(np.frombuffer(buf7b, dtype=np.uint64))
-        if showmessages:
-            print("Package")
-            print(list(value7))
-        totalbytesread += packagedatasize
-        # We know that value7[7] (per the Livox lvx documentation - see the table on page 8)
-        # contains the data type that is going to be read
-        datatype = value7[7]
-        return [totalbytesread, datatype]
+        datatype_points.append(buf31)
+        return [offset + _PACKAGE_SIZES[6], points_type_6, datatype_points]
 
     @staticmethod
     def read_frame_header(fobj, frblocksize=24, showmessages=False):
@@ -655,22 +749,163 @@ class BinaryReaders:
 
         # read in a frame header block
         buf4 = fobj.read(frblocksize)
-        if not buf4:
-            if showmessages:
-                print("Done with frame reading")
-            return []
-        # unpack the values using the known data type - little endian, 3 unsigned long long types
-        value4 = struct.unpack('<3q', buf4)
-        # for debugging:
-        if showmessages:
-            print("Frame Header")
-            print(list(value4))
-        value4 = list(value4)
-        # return the list of values from the frame header
-        return value4
+        # unpack it the same way as the frame headers of a memory mapped file
+        return _read_frame_header(buf4, 0, frblocksize, showmessages)[1]
+
+    @staticmethod
+    def iter_frames(pathtofile, wanted=None, max_frames=None, showmessages=False):
+        '''
+        A generator which reads Livox proprietary .lvx binary files one frame at a time, so that only the points of a
+        single frame are held in memory (lvxreader holds every point of the file)
+
+        Parameters
+        ----------
+        pathtofile : str
+            String containing the path to the .lvx file
+        wanted : int, optional
+            The data type (0 to 5) of the points to read, the packages of the other point data types are skipped over.
+            By default the first data type (0 to 5) with points in each frame is returned
+        max_frames : int, optional
+            The maximum number of frames to read (all of them by default)
+        showmessages : bool
+            Whether to print the frame header information as it is read
+
+        Yields
+        ------
+        frameindex : int
+            The index of the frame within the file
+        datatype : int
+            The data type of the frame's points (None if the frame has no points of a wanted data type)
+        points : dict
+            The frame's points stored per field (xyz_raw, xyz_divisors, reflectivity, return_num, tag) as taken by
+            BinaryReaders (None if the frame has no points of a wanted data type)
+        imudata : numpy.ndarray
+            The frame's IMU data (data type 6), one row per record
+        '''
+
+        # the list each collected data type's packages' points are gathered in for a single frame (None for the data
+        # types that are not wanted), and the size of its packages' points
+        packages = {datatype: ([] if wanted is None or datatype in (wanted, 6) else None, packagesize)
+                    for datatype, packagesize in _PACKAGE_SIZES.items()}
+
+        with open(pathtofile, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # the frames are views of the map (no copies), they must all be released before it is closed
+            view = memoryview(mm)
+            try:
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                # skip the public header, private header and device info blocks (the device count is the 2nd field of
+                # the private header)
+                devicecount = _S_PRIVATE.unpack_from(mm, _S_HEADER.size)[1]
+                offset = _S_HEADER.size + _S_PRIVATE.size + devicecount * _S_DEVICE.size
+
+                fcounter = 0
+                while max_frames is None or fcounter < max_frames:
+                    offset, fheaderdata = _read_frame_header(mm, offset, _S_FRAME.size, showmessages)
+                    # stop at the end of the file, or if the frame index does not match up with the frame count
+                    if not fheaderdata or fheaderdata[2] != fcounter:
+                        break
+                    totalbytestoread = fheaderdata[1] - (fheaderdata[0] + _S_FRAME.size)
+                    framesize = max(0, min(totalbytestoread, len(mm) - offset))
+                    _walk_packages(view, [(offset, framesize)], packages)
+                    offset += framesize
+
+                    # decode the frame's IMU data and its first data type with points
+                    imudata = _join_imu(packages[6][0])
+                    datatype = points = None
+                    for pointtype, (recorddtype, decoder, divisors) in _POINT_DECODERS.items():
+                        if packages[pointtype][0]:
+                            points = _join_points(packages[pointtype][0], recorddtype, decoder, divisors)
+                            if len(points['xyz_raw']) != 0:
+                                datatype = pointtype
+                                break
+                            points = None
+                    for datatype_points, packagesize in packages.values():
+                        if datatype_points is not None:
+                            datatype_points.clear()
+
+                    yield fcounter, datatype, points, imudata
+                    fcounter += 1
+            finally:
+                for datatype_points, packagesize in packages.values():
+                    if datatype_points is not None:
+                        datatype_points.clear()
+                view.release()
+
+    @staticmethod
+    def read_metadata(pathtofile):
+        '''
+        A method which reads only the header blocks and the frame headers of Livox .lvx binary files (the frame bodies
+        are skipped over, so its cost does not grow with the number of points)
+
+        Parameters
+        ----------
+        pathtofile : str
+            String containing the path to the .lvx file
+
+        Returns
+        ------
+        metadata : dict
+            The decoded public header block ('public_header'), private header block ('private_header') and device
+            info blocks ('devices', one list per device), and the offset and size (bytes) of every frame ('frames')
+        '''
+        with open(pathtofile, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hblock = list(_S_HEADER.unpack_from(mm, 0))
+            hblock[0] = hblock[0].decode('utf-8')
+            hblock[1] = hblock[1].decode('utf-8')
+            pblock = list(_S_PRIVATE.unpack_from(mm, _S_HEADER.size))
+            offset = _S_HEADER.size + _S_PRIVATE.size
+            deviceinfo = []
+            for dcounter in range(pblock[1]):
+                diblock = list(_S_DEVICE.unpack_from(mm, offset))
+                diblock[0] = diblock[0].decode('utf-8')
+                diblock[1] = diblock[1].decode('utf-8')
+                deviceinfo.append(diblock)
+                offset += _S_DEVICE.size
+            frames = []
+            _read_frame_table(mm, offset, frames)
+        return {'public_header': hblock, 'private_header': pblock, 'devices': deviceinfo, 'frames': frames}
+
+    @classmethod
+    def read_points(cls, pathtofile, frame_range=None, wanted=None, metadata=None):
+        '''
+        A method which reads the points of a range of frames of Livox .lvx binary files (the other frames are not
+        read) and instantiates a BinaryReaders object
+
+        Parameters
+        ----------
+        pathtofile : str
+            String containing the path to the .lvx file
+        frame_range : tuple, optional
+            The (start, stop) indices of the frames to read, as in a slice (all the frames by default)
+        wanted : int, optional
+            The data type (0 to 5) of the points to read (see lvxreader)
+        metadata : dict, optional
+            The metadata of the file from read_metadata, to not read the frame headers again
+
+        Returns
+        ------
+        cls(datatype_points, imudata):
+            as returned by lvxreader (None if the frames have no points)
+        '''
+        if metadata is None:
+            metadata = BinaryReaders.read_metadata(pathtofile)
+        frames = metadata['frames']
+        if frame_range is not None:
+            frames = frames[slice(*frame_range)]
+
+        with open(pathtofile, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                datatype, points, imudata = _decode_frames(view, frames, wanted)
+            finally:
+                view.release()
+        if points is not None:
+            return cls(points, imudata, datatype)
 
     @classmethod
-    def lvxreader(cls, pathtofile, blockstoread=1, showmessages=False):
+    def lvxreader(cls, pathtofile, blockstoread=1, showmessages=False, wanted=None):
         '''
         A method which reads in Livox proprietary .lvx binary files and instantiates a BinaryReaders object.
         The structure of the binary file is detailed in the
@@ -682,198 +917,92 @@ class BinaryReaders:
         pathtofile : str
             String containing the path to the .lvx file
         blockstoread : int
-            Number of blocks to read from the .lvx file.
+            Number of blocks of frames (each numbered from frame index 0) to read from the .lvx file, after its single
+            set of header blocks.
+        showmessages : bool
+            Whether to print the header, device and frame information as it is read
+        wanted : int, optional
+            The data type (0 to 5) of the points to read, the packages of the other point data types are skipped over
+            without being collected or decoded. By default the first data type (0 to 5) with points is returned
 
         Returns
         ------------
         cls(datatype_points):
-            list of lists (can be converted into numpy array for plotting) that contains the data from packages (unknown data type)
+            the data from packages (unknown data type), stored per point field (xyz_raw, reflectivity, return_num, tag) and
+            also available as a numpy array with one row per point (datapoints)
         cls(imudata):
-            list of lists containing IMU data (data type 6)
+            numpy array (one row per record) containing IMU data (data type 6)
         '''
 
         # The size of various blocks in the binary file - refer to the Livox documentation for the .lvx file format to see
-        # where these numbers come from.
-        # Sum of the size column, on page 2 of the .lvx documentation
-        # 16 + 1 + 1 + 1 + 1 + 4 = 24
-        hblocksize = 24
-        # Sum of the size column, private header block table on page 3 of the .lvx documentation
-        # 4 + 1 = 5
-        pblocksize = 5
-        # Sum of the size column, Devices Info Block table on page 3/4 of the .lvx documentation
-        # 59 = 59
-        diblocksize = 59
-        # Frame header block size - Each frame header is accompanied by N packages
-        # Bottom table on page 4 of .lvx documentaiton
-        # 8 + 8 + 8 = 24
-        frblocksize = 24
-        # The beginning of each package begins with a 19 byte "header" so to speak - that is everything in the
-        # size column on page 5 from the package table added up (neglecting the "depends" values):
-        # 1 + 1 + 1 + 1 + 1 + 4 + 1 + 1 + 8 = 19
-        packagedatasize = 19
-        # Data type zero size (page 5)
-        # 4 + 4 + 4 + 1 = 13
-        datasize_0 = 13
-        # Data type one size (page 6)
-        # 4 + 2 + 2 + 1 = 9
-        datasize_1 = 9
-        # Data type two size (page 6)
-        # 4 + 4 + 4 + 1 + 1 = 14
-        datasize_2 = 14
-        # Data type three size (page 6)
-        # 4 + 2 + 2 + 1 + 1 = 10
-        datasize_3 = 10
-        # Data type four size (page 6)
-        # 4 + 4 + 4 + 1 + 1 + 4 + 4 + 4 + 1 + 1 = 28
-        datasize_4 = 28
-        # Data type five size (page 7)
-        # 2 + 2 + 4 + 1 + 1 + 4 + 1 + 1 = 16
-        datasize_5 = 16
-        # Data type six size (page 7)
-        # 4 + 4 + 4 + 4 + 4 + 4 = 24
-        datasize_6 = 24
-
-        # data type zero (x, y, z, reflectivity)
-        # data type 1 (depth, theta, phi, reflectivity)
-        # data type 2 (x, y, z, reflectivity, tag)
-        # data type 3 (depth, theta, phi, reflectivity, tag)
-        # data type 4 (2 returns - x, y, z, reflectivity and tags)
-        # data type 5 (2 returns - depth, theta, phi, reflectivity, tags)
-        # data type 6 (IMU data - gyro x, y, z and accelerations x, y, z)
-
-        datatype0_points = []
-        datatype1_points = []
-        datatype2_points = []
-        datatype3_points = []
-        datatype4_points = []
-        datatype5_points = []
-        datatype6_points = []
+        # where these numbers come from. The public header block (16 + 1 + 1 + 1 + 1 + 4 = 24, page 2), the private
+        # header block (4 + 1 = 5, page 3), the device info block (59, pages 3/4) and the frame header block (8 + 8 + 8 =
+        # 24, bottom table on page 4 of .lvx documentaiton, each frame header is accompanied by N packages) are given by
+        # _S_HEADER, _S_PRIVATE, _S_DEVICE and _S_FRAME, the package header and the package sizes of each data type (pages
+        # 5 to 7) by _PACKAGE_HEADER_SIZE and _PACKAGE_SIZES
+
+        # the offset and size (bytes) of every frame to read
+        frames = []
 
         # A counter to keep track of blocks
         counter = 0
-
-        with open(pathtofile, "rb") as f:
-            while counter < blockstoread:
-                # We know that each Livox file has only one Public Header block
-                buf = f.read(hblocksize)
-                # We know that each Livox file has only one Private Header block
-                buf2 = f.read(pblocksize)
-
-                if not buf:
-                    break
-
-                hblock = struct.unpack('<16s4cI', buf)
-                pblock = struct.unpack('<IB', buf2)
-
+        # offset (bytes) of the next block to read within the file
+        offset = 0
+
+        # the file is memory mapped and parsed in place (no read calls per package or per point), the OS pages it in
+        # on demand
+        with open(pathtofile, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # the file is read through views of the map (no copies), they must all be released before it is closed
+            view = memoryview(mm)
+            try:
+                # the file is parsed front to back, so let the OS read ahead
+                if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+
+                # the header blocks are read once, ahead of the blocks of frames
+                # We know that each Livox file has only one Public Header block, it is only decoded to be shown
                 if showmessages:
                     print("Public Header block")
-                hblock = list(hblock)
-                hblock[0] = hblock[0].decode('utf-8')
-                hblock[1] = hblock[1].decode('utf-8')
-                if showmessages:
+                    hblock = list(_S_HEADER.unpack_from(mm, offset))
+                    hblock[0] = hblock[0].decode('utf-8')
+                    hblock[1] = hblock[1].decode('utf-8')
                     print(hblock)
-
-                if showmessages:
-                    print("Private Header Block")
-                pblock = list(pblock)
+                offset += _S_HEADER.size
+                # We know that each Livox file has only one Private Header block
+                pblock = list(_S_PRIVATE.unpack_from(mm, offset))
+                offset += _S_PRIVATE.size
                 # private header gives number of devices
                 devicecount = pblock[1]
                 if showmessages:
+                    print("Private Header Block")
                     print(pblock)
 
-                # place device info in a list
-                dcounter = 0;
-                deviceinfo = []
-                while (dcounter < devicecount):
-                    buf3 = f.read(diblocksize)
-                    diblock = struct.unpack('<16s16s3B6f', buf3)
-                    diblock = list(diblock)
-                    diblock[0] = diblock[0].decode('utf-8')
-                    diblock[1] = diblock[1].decode('utf-8')
-                    deviceinfo.append(diblock)
-                    dcounter += 1
+                # place device info in a list (only to be shown, otherwise the device info blocks are skipped over)
                 if showmessages:
+                    deviceinfo = []
+                    for dcounter in range(devicecount):
+                        diblock = list(_S_DEVICE.unpack_from(mm, offset + dcounter * _S_DEVICE.size))
+                        diblock[0] = diblock[0].decode('utf-8')
+                        diblock[1] = diblock[1].decode('utf-8')
+                        deviceinfo.append(diblock)
                     print("Devices Info Block")
                     print(deviceinfo)
+                offset += devicecount * _S_DEVICE.size
 
-                counter += 1
-
-                # counter to keep track of how many frames read
-                fcounter = 0;
-                while True:
-                    # Call the static method read_frame_header defined above
-                    fheaderdata = BinaryReaders.read_frame_header(f, frblocksize)
-                    if not fheaderdata:
-                        break
-                    currentoffset = fheaderdata[0] + frblocksize
-                    nextoffset = fheaderdata[1]
-                    frameindex = fheaderdata[2]
-                    # check if frame index matches up with frame count -- if not, stop frame reading
-                    if (frameindex != fcounter):
+                while counter < blockstoread:
+                    if offset >= len(mm):
                         break
-
-                    fcounter += 1
-
-                    # counter to keep track of how many packages read
-                    pcounter = 0;
-                    totalbytesread = 0;
-                    totalbytestoread = nextoffset - currentoffset
-                    if showmessages:
-                        print(totalbytestoread)
-                    while (totalbytesread < totalbytestoread):
-                        # read all packages until next frame
-                        pheader = BinaryReaders.read_package_header(f, totalbytesread, packagedatasize)
-                        totalbytesread = pheader[0]
-                        datatype = pheader[1]
-                        if (datatype == 0):
-                            package = BinaryReaders.data_type0_reader(f, totalbytesread, datatype0_points, datasize_0)
-                            totalbytesread = package[0]
-                            datatype0_points = package[2]
-                        if (datatype == 1):
-                            package = BinaryReaders.data_type1_reader(f, totalbytesread, datatype1_points, datasize_1)
-                            totalbytesread = package[0]
-                            datatype1_points = package[2]
-                        if (datatype == 2):
-                            package = BinaryReaders.data_type2_reader(f, totalbytesread, datatype2_points, datasize_2)
-                            totalbytesread = package[0]
-                            datatype2_points = package[2]
-                        if (datatype == 3):
-                            package = BinaryReaders.data_type3_reader(f, totalbytesread, datatype3_points, datasize_3)
-                            totalbytesread = package[0]
-                            datatype3_points = package[2]
-                        if (datatype == 4):
-                            package = BinaryReaders.data_type4_reader(f, totalbytesread, datatype4_points, datasize_4)
-                            totalbytesread = package[0]
-                            datatype4_points = package[2]
-                        if (datatype == 5):
-                            package = BinaryReaders.data_type5_reader(f, totalbytesread, datatype5_points, datasize_5)
-                            totalbytesread = package[0]
-                            datatype5_points = package[2]
-                        if (datatype == 6):
-                            package = BinaryReaders.data_type6_reader(f, totalbytesread, datatype6_points, datasize_6)
-                            totalbytesread = package[0]
-                            datatype6_points = package[2]
-                        # print("Total Bytes Read")
-                        # print(totalbytesread)
-                        # print("Total bytes to read")
-                        # print(totalbytestoread)
-                        # print("Package index:", pcounter)
-                        pcounter += 1
-        if datatype != 6:
-            if showmessages:
-                print('Data type', datatype)
-        if len(datatype0_points) != 0:
-            return cls(datatype0_points, datatype6_points, 0)
-        if len(datatype1_points) != 0:
-            return cls(datatype1_points, datatype6_points, 1)
-        if len(datatype2_points) != 0:
-            return cls(datatype2_points, datatype6_points, 2)
-        if len(datatype3_points) != 0:
-            return cls(datatype3_points, datatype6_points, 3)
-        if len(datatype4_points) != 0:
-            return cls(datatype4_points, datatype6_points, 4)
-        if len(datatype5_points) != 0:
-            return cls(datatype5_points, datatype6_points, 5)
+                    counter += 1
+                    # the frames are recorded, their packages are walked once all the frames are known
+                    offset = _read_frame_table(mm, offset, frames, showmessages)
+
+                # read all packages of every frame, taking their points as views of the map to be joined and decoded
+                # all at once
+                datatype, points, imudata = _decode_frames(view, frames, wanted, showmessages)
+            finally:
+                view.release()
+        if points is not None:
+            return cls(points, imudata, datatype)
 
         # TO PLOT LIVOX DATA
         # in tester class
@@ -19,11 +19,18 @@ Change Log:
     - v1.0.1 released - May 27th 2020
     - v1.0.2 and v1.0.3 released - May 29th 2020
     - v1.1.0 released - Sept. 11th 2020 (NEVER FORGET!)
+    - unreleased - BinaryFileReader.py: .lvx files are memory mapped and their packages are decoded all at once, the
+      BinaryReaders.read_package_header and data_type0_reader to data_type6_reader methods take a frame buffer and an
+      offset (buf, offset, ...) rather than a file object and the bytes read so far, and return the offset past what
+      they read (read_frame_header still reads a frame header from a file object). The datapoints and imudata of a BinaryReaders object are now
+      numpy arrays (one row per point or IMU record) rather than lists of lists
     
 """
 
 # standard modules
 import binascii
+import collections
+import queue
 import select
 import socket
 import struct
@@ -41,6 +48,251 @@ import laspy
 from deprecated import deprecated
 
 
+# point record layouts within a Livox point cloud data packet, keyed by the packet's data type
+_POINT_DTYPES = {
+    # Mid-40/100 Cartesian
+    0: np.dtype([('x', '<i4'), ('y', '<i4'), ('z', '<i4'), ('intensity', 'u1')]),
+    # Mid-40/100 Spherical
+    1: np.dtype([('distance', '<u4'), ('zenith', '<u2'), ('azimuth', '<u2'), ('intensity', 'u1')]),
+    # Horizon/Tele-15 Cartesian single return
+    2: np.dtype([('x', '<i4'), ('y', '<i4'), ('z', '<i4'), ('intensity', 'u1'), ('tag', 'u1')]),
+    # Horizon/Tele-15 Spherical single return
+    3: np.dtype([('distance', '<u4'), ('zenith', '<u2'), ('azimuth', '<u2'), ('intensity', 'u1'), ('tag', 'u1')]),
+    # Horizon/Tele-15 Cartesian dual return
+    4: np.dtype([('x', '<i4'), ('y', '<i4'), ('z', '<i4'), ('intensity', 'u1'), ('tag', 'u1'),
+                 ('x2', '<i4'), ('y2', '<i4'), ('z2', '<i4'), ('intensity2', 'u1'), ('tag2', 'u1')]),
+    # Horizon/Tele-15 Spherical dual return
+    5: np.dtype([('zenith', '<u2'), ('azimuth', '<u2'), ('distance', '<u4'), ('intensity', 'u1'), ('tag', 'u1'),
+                 ('distance2', '<u4'), ('intensity2', 'u1'), ('tag2', 'u1')])}
+
+# number of points within a single point cloud data packet, keyed by the packet's data type
+_POINTS_PER_PACKET = {0: 100, 1: 100, 2: 96, 3: 96, 4: 48, 5: 48}
+
+# precompiled little-endian formats used to read the data packet header fields in place (struct.unpack_from)
+_UINT32_STRUCT = struct.Struct('<I')
+_UINT64_STRUCT = struct.Struct('<Q')
+
+# precompiled little-endian format of the timestamp appended to each OPL binary IMU data record
+_FLOAT64_STRUCT = struct.Struct('<d')
+
+# Livox SDK protocol checksums of the command/response packets (frame header CRC16, whole packet CRC32), the lookup
+# tables are only built once
+_CRC16 = crcmod.mkCrcFun(0x11021, rev=True, initCrc=0x4C49)
+_CRC32 = crcmod.mkCrcFun(0x104C11DB7, rev=True, initCrc=0x564F580A, xorOut=0xFFFFFFFF)
+
+# little-endian layouts of a command packet's frame header (SOF, version, length, cmd_type, seq_num) and checksums
+_CMD_HEADER_STRUCT = struct.Struct('<BBHBH')
+_CMD_CRC16_STRUCT = struct.Struct('<H')
+_CMD_CRC32_STRUCT = struct.Struct('<I')
+
+# size (bytes) of the point cloud data packet header that precedes the point records
+_PACKET_HEADER_SIZE = 18
+
+# size (bytes) of a command packet's frame header plus CRC16, cmd_set and cmd_id, and CRC32, i.e., all but the data
+_CMD_FRAME_SIZE = _CMD_HEADER_STRUCT.size + 2 + 2 + 4
+
+# size (bytes) of the pre-allocated buffer point cloud data packets are received into
+_PACKET_BUFFER_SIZE = 1500
+
+# requested OS receive buffer size (bytes) of the point cloud data socket, so that short OS/disk stalls are absorbed
+# without dropping data packets (the OS may still cap it, e.g., Linux's net.core.rmem_max)
+_DATA_SOCKET_RCVBUF = 16 * 1024 * 1024
+
+# smallest OS receive buffer size (bytes) requested of the point cloud data socket when the OS refuses larger ones
+_MIN_DATA_SOCKET_RCVBUF = 256 * 1024
+
+# max. time (seconds) the capture threads wait for a data packet, before checking again whether they've been stopped
+# (waiting in select() rather than polling it in a busy loop)
+_CAPTURE_POLL_TIMEOUT = 0.1
+
+# (time shift of the first point, time between points) in seconds for single return firmware, keyed by data type
+_SINGLE_RETURN_TIMING = {0: (0.00001, 0.00001),
+                         1: (0.00001, 0.00001),
+                         2: (0.000004167, 0.000004167),
+                         3: (0.000004167, 0.00001),
+                         4: (0.000002083, 0.000002083),
+                         5: (0.000002083, 0.00001)}
+
+# time (seconds) between laser pulses of the ASCII captures, keyed by firmware type (1 = single return, 2 = double return,
+# 3 = triple return firmware)
+_ASCII_PULSE_SPACING = {1: 0.00001, 2: 0.00001, 3: 0.000016666}
+
+# data packets per second per return of the stored ASCII capture (Mid-40/100, 100 points per packet), and the max. capture
+# duration (seconds) the stored ASCII capture's point arrays are initially allocated for
+_STORED_PACKET_RATE = 1000
+_STORED_PREALLOCATE_SECS = 60
+
+# write buffer size (bytes) of the real-time OPL binary IMU data file, and the max. number of data packets written per
+# batch to the real-time OPL binary point data file
+_BIN_WRITE_BUFFER_SIZE = 1 << 20
+_BIN_WRITE_BATCH_PACKETS = 64
+
+# time (seconds) the real-time binary writer thread sleeps once it has written everything handed off to it (packets
+# arriving meanwhile are then written as a single batch)
+_BIN_WRITE_IDLE_WAIT = 0.01
+
+# number of data packets whose points are collected into a block, that is then formatted and written as a single batch
+# to the real-time ASCII point data file
+_CSV_WRITE_BATCH_PACKETS = 64
+
+# write buffer size (bytes) of the ASCII (CSV) point and IMU data files
+_CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# OPL binary IMU data file record layout
+_IMU_RECORD_DTYPE = np.dtype([('gyro_x', '<f4'), ('gyro_y', '<f4'), ('gyro_z', '<f4'),
+                              ('acc_x', '<f4'), ('acc_y', '<f4'), ('acc_z', '<f4'), ('time', '<f8')])
+
+# CSV row format of the OPL binary IMU data records
+_IMU_CSV_ROW_FORMAT = ",".join(["%.6f"] * len(_IMU_RECORD_DTYPE.names)) + "\n"
+
+# number of OPL binary records read (and formatted) at a time when converting to CSV or LAS
+_CONVERT_CHUNK_SIZE = 100000
+
+
+# assembles a Livox SDK command packet (cmd_type 0 = CMD, seq_num 0) with the command's data, including the frame header
+# CRC16 and the whole packet CRC32 checksums
+def _livoxCommand(cmdSet, cmdId, data=b""):
+    header = _CMD_HEADER_STRUCT.pack(0xAA, 1, _CMD_FRAME_SIZE + len(data), 0, 0)
+    packet = header + _CMD_CRC16_STRUCT.pack(_CRC16(header)) + bytes((cmdSet, cmdId)) + data
+
+    return packet + _CMD_CRC32_STRUCT.pack(_CRC32(packet))
+
+
+# writes all the buffers to the file descriptor, as a single gather write where available (os.writev), otherwise
+# buffer by buffer; the GIL is released for the entire system call, and a partial write is finished with os.write
+def _writeBuffers(fd, buffers):
+    written = 0
+    if hasattr(os, "writev"):
+        written = os.writev(fd, buffers)
+
+    for buf in buffers:
+        view = memoryview(buf).cast("B")
+        if written >= view.nbytes:
+            written -= view.nbytes
+            continue
+
+        view = view[written:]
+        written = 0
+        while view.nbytes:
+            view = view[os.write(fd, view):]
+
+
+# enlarges a socket's OS receive buffer; on Linux the request is first forced past the net.core.rmem_max cap (only
+# allowed with the CAP_NET_ADMIN capability), otherwise the request is halved until the OS accepts it (e.g., macOS's limit)
+# returns the receive buffer size the OS actually granted (Linux reports twice the size, to include its bookkeeping)
+def _enlargeReceiveBuffer(sock, rcvBufSize):
+    forced = False
+    if hasattr(socket, "SO_RCVBUFFORCE"):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUFFORCE, rcvBufSize)
+            forced = True
+        except OSError:
+            pass
+
+    while not forced and rcvBufSize >= _MIN_DATA_SOCKET_RCVBUF:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvBufSize)
+            break
+        except OSError:
+            rcvBufSize //= 2
+
+    return sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+
+# memory maps an OPL binary file's records and yields them in blocks (copied out of the map), so that large files are
+# paged in by the OS on demand and are never loaded into memory all at once
+def _oplRecordChunks(filePathAndName, recordDtype, numRecs):
+    if numRecs <= 0:
+        return
+
+    allRecords = np.memmap(filePathAndName, dtype=recordDtype, mode="r", offset=15, shape=(numRecs,))
+    for i in range(0, numRecs, _CONVERT_CHUNK_SIZE):
+        yield np.array(allRecords[i:i + _CONVERT_CHUNK_SIZE])
+
+    # release the map right away (the binary file may be deleted after the conversion)
+    del allRecords
+
+
+# OPL binary point data file record layout (point record, timestamp, and an ASCII return number for multiple return firmware)
+def _oplRecordDtype(firmwareType, dataType):
+    fields = _POINT_DTYPES[dataType].descr + [('time', '<f8')]
+    if firmwareType > 1:
+        fields.append(('returnNum', 'S1'))
+
+    return np.dtype(fields)
+
+
+# spherical observations (distance in mm, zenith and azimuth in 0.01 degrees) to float32 Cartesian coordinates in metres
+def _sphericalToCartesian(distance, zenith, azimuth):
+    zenith = np.radians(zenith, dtype=np.float64) / 100.0
+    azimuth = np.radians(azimuth, dtype=np.float64) / 100.0
+    distance = distance / 1000.0
+
+    z = np.cos(zenith)
+    z *= distance
+    np.sin(zenith, out=zenith)
+    zenith *= distance
+    x = np.cos(azimuth)
+    x *= zenith
+    y = np.sin(azimuth, out=azimuth)
+    y *= zenith
+
+    return x.astype(np.float32), y.astype(np.float32), z.astype(np.float32)
+
+
+# CSV row format of an OPL data class's point records
+def _oplCSVFormat(dataClass):
+    # Cartesian coordinates (odd data classes) vs. spherical coordinates (even data classes)
+    if dataClass % 2 == 1:
+        fmt = ["%.3f", "%.3f", "%.3f"]
+    else:
+        fmt = ["%.3f", "%.2f", "%.2f"]
+    fmt += ["%d", "%.6f", "%d"]
+    if dataClass >= 5:
+        fmt += ["%d", "%d", "%d"]
+
+    return ",".join(fmt) + "\n"
+
+
+# formats a whole table of values as CSV text with a single %-format operation (the C-level string formatting
+# then does all the work, rather than a Python-level loop over the rows as np.savetxt does)
+def _formatCSVRows(table, rowFormat):
+    return (rowFormat * len(table)) % tuple(table.ravel().tolist())
+
+
+# table of CSV values of an OPL data class's point records, one row per return (dual returns interleaved)
+def _oplCSVColumns(records, dataClass):
+    numRecs = len(records)
+
+    def returnColumns(suffix, returnNum):
+        if dataClass % 2 == 1:
+            cols = [records['x' + suffix] / 1000.0, records['y' + suffix] / 1000.0, records['z' + suffix] / 1000.0]
+        else:
+            cols = [records['distance' + suffix] / 1000.0, records['zenith'] / 100.0, records['azimuth'] / 100.0]
+        cols += [records['intensity' + suffix], records['time'], returnNum]
+        if dataClass >= 5:
+            tag = records['tag' + suffix]
+            # return type, spatial confidence, intensity confidence
+            cols += [(tag >> 2) & 3, (tag >> 6) & 3, (tag >> 4) & 3]
+
+        return np.column_stack(cols)
+
+    if dataClass == 3 or dataClass == 4:
+        return returnColumns("", records['returnNum'].astype(np.float64))
+
+    first = returnColumns("", np.ones(numRecs))
+    if dataClass != 7 and dataClass != 8:
+        return first
+
+    # dual return data, the second return's row follows the first return's row
+    second = returnColumns("2", np.full(numRecs, 2.0))
+    table = np.empty((2 * numRecs, first.shape[1]))
+    table[0::2] = first
+    table[1::2] = second
+
+    return table
+
+
 class _heartbeatThread(object):
 
     def __init__(self, interval, transmit_socket, send_to_IP, send_to_port, send_command, showMessages, format_spaces):
@@ -51,7 +303,12 @@ class _heartbeatThread(object):
         self.t_command = send_command
         self.started = True
         self.work_state = -1
-        self.idle_state = 0
+        # monotonic time the last heartbeat request/response finished (None until the first one has), see idle_state
+        self._lastBeat = None
+        # wakes the heartbeat thread up early when it's stopped
+        self._stopEvent = threading.Event()
+        # set (and the heartbeat stopped) when the sensor reports an error, rather than exiting the heartbeat thread
+        self.error_event = threading.Event()
         self._showMessages = showMessages
         self._format_spaces = format_spaces
 
@@ -59,6 +316,17 @@ class _heartbeatThread(object):
         self.thread.daemon = True
         self.thread.start()
 
+    # counts down from 9 (right after a heartbeat, when commands can be sent without colliding with the heartbeat's
+    # response) to 0 over the heartbeat interval, computed when read rather than updated by the heartbeat thread
+    @property
+    def idle_state(self):
+        if not self.started:
+            return 9
+        if self._lastBeat is None:
+            return 0
+
+        return max(9 - int(10.0 * (time.monotonic() - self._lastBeat) / self.interval), 0)
+
     def run(self):
         while True:
             if self.started:
@@ -67,8 +335,7 @@ class _heartbeatThread(object):
                 # check for proper response from heartbeat request
                 if select.select([self.t_socket], [], [], 0.1)[0]:
                     binData, addr = self.t_socket.recvfrom(22)
-                    tempObj = openpylivox()
-                    _, ack, cmd_set, cmd_id, ret_code_bin = tempObj._parseResp(binData)
+                    _, ack, cmd_set, cmd_id, ret_code_bin = openpylivox._parseRespPacket(binData)
 
                     if ack == "ACK (response)" and cmd_set == "General" and cmd_id == "3":
                         ret_code = int.from_bytes(ret_code_bin[0], byteorder='little')
@@ -81,24 +348,25 @@ class _heartbeatThread(object):
 
                             if self.work_state == 4:
                                 print("   " + self.IP + self._format_spaces + self._format_spaces + "   -->     *** ERROR: HEARTBEAT ERROR MESSAGE RECEIVED ***")
-                                sys.exit(0)
+                                self.error_event.set()
+                                break
                     elif ack == "MSG (message)" and cmd_set == "General" and cmd_id == "7":
                         # not given an option to hide this message!!
                         print("   " + self.IP + self._format_spaces + self._format_spaces + "   -->     *** ERROR: ABNORMAL STATUS MESSAGE RECEIVED ***")
-                        sys.exit(1)
+                        self.error_event.set()
+                        break
                     else:
                         if self._showMessages: print("   " + self.IP + self._format_spaces + self._format_spaces + "   -->     incorrect heartbeat response")
 
-                for i in range(9, -1, -1):
-                    self.idle_state = i
-                    time.sleep(self.interval / 10.0)
+                self._lastBeat = time.monotonic()
+                self._stopEvent.wait(self.interval)
             else:
                 break
 
     def stop(self):
         self.started = False
+        self._stopEvent.set()
         self.thread.join()
-        self.idle_state = 9
 
 
 class _dataCaptureThread(object):
@@ -136,39 +404,59 @@ class _dataCaptureThread(object):
         self.self_heating_status = -1
         self.ptp_status = -1
         self.time_sync_status = -1
+        # raw status codes of the last data packet, see updateStatus
+        self._statusCode = -1
+        self._binLayouts = {}
 
         if duration == 0:
             self.duration = 126230400  # 4 years of time (so technically not indefinite)
 
+        # the capture threads drain the receive buffers without blocking, and only wait (in select()) once they're empty
+        self.d_socket.setblocking(False)
+        if self.fileType == 2:
+            self.i_socket.setblocking(False)
+
         self.thread = None
+        # set once the capture thread has finished (capture duration reached and data file written, or stopped)
+        self.captureDone = threading.Event()
 
         if self.fileType == 1:
-            self.thread = threading.Thread(target=self.run_realtime_csv, args=())
+            self.thread = threading.Thread(target=self._runThread, args=(self.run_realtime_csv,))
         elif self.fileType == 2:
-            self.thread = threading.Thread(target=self.run_realtime_bin, args=())
+            self.thread = threading.Thread(target=self._runThread, args=(self.run_realtime_bin,))
         else:
-            self.thread = threading.Thread(target=self.run, args=())
+            self.thread = threading.Thread(target=self._runThread, args=(self.run,))
 
         self.thread.daemon = True
         self.thread.start()
 
+    def _runThread(self, target):
+
+        try:
+            target()
+        finally:
+            self.captureDone.set()
+
     def run(self):
 
         # read point cloud data packet to get packet version and datatype
         # keep looping to 'consume' data that we don't want included in the captured point cloud data
 
         breakByCapture = False
+        # packets are received into the same pre-allocated buffer (no new bytes object per packet), the captured points
+        # are copied out of it
+        pktBuffer = memoryview(bytearray(_PACKET_BUFFER_SIZE))
         while True:
 
             if self.started:
-                selectTest = select.select([self.d_socket], [], [], 0)
+                selectTest = select.select([self.d_socket], [], [], _CAPTURE_POLL_TIMEOUT)
                 if selectTest[0]:
-                    data_pc, addr = self.d_socket.recvfrom(1500)
-                    version = int.from_bytes(data_pc[0:1], byteorder='little')
-                    self.dataType = int.from_bytes(data_pc[9:10], byteorder='little')
-                    timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                    timestamp1 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                    self.updateStatus(data_pc[4:8])
+                    data_pc = pktBuffer[:self.d_socket.recv_into(pktBuffer)]
+                    version = data_pc[0]
+                    self.dataType = data_pc[9]
+                    timestamp_type = data_pc[8]
+                    timestamp1 = self.getTimestamp(data_pc, timestamp_type, 10)
+                    self.updateStatus(data_pc, 4)
                     if self.isCapturing:
                         self.startTime = timestamp1
                         breakByCapture = True
@@ -181,18 +469,6 @@ class _dataCaptureThread(object):
             # check data packet is as expected (first byte anyways)
             if version == 5:
 
-                # lists to capture point cloud data stream info
-                # TODO: should use an object, I know, I know!
-                timestamps = []
-                timestamp_types = []
-                slot_ids = []
-                lidar_ids = []
-                coord1s = []
-                coord2s = []
-                coord3s = []
-                intensities = []
-                returnNums = []
-
                 # delayed start to capturing data check (secsToWait parameter)
                 timestamp2 = self.startTime
                 while True:
@@ -200,11 +476,11 @@ class _dataCaptureThread(object):
                         timeSinceStart = timestamp2 - self.startTime
                         if timeSinceStart <= self.secsToWait:
                             # read data from receive buffer and keep 'consuming' it
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp2 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                                self.updateStatus(data_pc[4:8])
+                            if select.select([self.d_socket], [], [], _CAPTURE_POLL_TIMEOUT)[0]:
+                                data_pc = pktBuffer[:self.d_socket.recv_into(pktBuffer)]
+                                timestamp_type = data_pc[8]
+                                timestamp2 = self.getTimestamp(data_pc, timestamp_type, 10)
+                                self.updateStatus(data_pc, 4)
                         else:
                             self.startTime = timestamp2
                             break
@@ -222,264 +498,68 @@ class _dataCaptureThread(object):
                     elif self.firmwareType == 3:
                         self.duration += (0.00055 * (self.duration / 2.0))
 
+                # raw point records and timestamp of each captured data packet, the points are all decoded at once after
+                # capturing; the arrays are pre-allocated for the expected number of data packets (and grown if needed)
+                timeOffsets = None
+                numPackets = 0
+                layout = self._asciiPointLayout()
+                if layout is not None:
+                    _, timeOffsets, pointReturnNums = layout
+                    pointDtype = _POINT_DTYPES[self.dataType]
+                    numPoints = len(timeOffsets)
+                    lastOffset = float(timeOffsets[-1])
+                    maxPackets = int(min(self.duration, _STORED_PREALLOCATE_SECS) * _STORED_PACKET_RATE * self.firmwareType) + 1
+                    pointBlocks = np.empty((maxPackets, numPoints), dtype=pointDtype)
+                    packetTimes = np.empty(maxPackets)
+
+                # resolve the methods and attributes used for every packet once, rather than on each pass of the main loop
+                poll = select.select
+                dataSockets = [self.d_socket]
+                recvInto = self.d_socket.recv_into
+                updateStatus = self.updateStatus
+                getTimestamp = self.getTimestamp
+                frombuffer = np.frombuffer
+                startTime = self.startTime
+                duration = self.duration
+
                 timestamp_sec = self.startTime
                 # main loop that captures the desired point cloud data
                 while True:
                     if self.started:
-                        timeSinceStart = timestamp_sec - self.startTime
+                        timeSinceStart = timestamp_sec - startTime
+
+                        if timeSinceStart <= duration:
 
-                        if timeSinceStart <= self.duration:
+                            # read data from receive buffer, only waiting for data once it's been drained
+                            try:
+                                data_pc = pktBuffer[:recvInto(pktBuffer)]
+                            except BlockingIOError:
+                                poll(dataSockets, [], [], _CAPTURE_POLL_TIMEOUT)
+                                continue
 
-                            # read data from receive buffer
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
+                            # version = int.from_bytes(data_pc[0:1], byteorder='little')
+                            # slot_id = int.from_bytes(data_pc[1:2], byteorder='little')
+                            # lidar_id = int.from_bytes(data_pc[2:3], byteorder='little')
 
-                                version = int.from_bytes(data_pc[0:1], byteorder='little')
-                                slot_id = int.from_bytes(data_pc[1:2], byteorder='little')
-                                lidar_id = int.from_bytes(data_pc[2:3], byteorder='little')
+                            # byte 3 is reserved
 
-                                # byte 3 is reserved
+                            # update lidar status information
+                            updateStatus(data_pc, 4)
 
-                                # update lidar status information
-                                self.updateStatus(data_pc[4:8])
-
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp_sec = self.getTimestamp(data_pc[10:18], timestamp_type)
-
-                                bytePos = 18
-
-                                # single return firmware (most common)
-                                if self.firmwareType == 1:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.00001
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            # X coordinate
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Y coordinate
-                                            coord2 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Z coordinate
-                                            coord3 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            # distance
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # zenith
-                                            coord2 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # azimuth
-                                            coord3 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-
-                                # double return firmware
-                                elif self.firmwareType == 2:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.00001
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # X coordinate
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Y coordinate
-                                            coord2 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Z coordinate
-                                            coord3 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-                                            returnNums.append(returnNum)
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # distance
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # zenith
-                                            coord2 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # azimuth
-                                            coord3 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-                                            returnNums.append(returnNum)
-
-                                # triple return firmware
-                                elif self.firmwareType == 3:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.000016666
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # X coordinate
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Y coordinate
-                                            coord2 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # Z coordinate
-                                            coord3 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-                                            returnNums.append(returnNum)
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # distance
-                                            coord1 = data_pc[bytePos:bytePos + 4]
-                                            bytePos += 4
-
-                                            # zenith
-                                            coord2 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # azimuth
-                                            coord3 = data_pc[bytePos:bytePos + 2]
-                                            bytePos += 2
-
-                                            # intensity
-                                            intensity = data_pc[bytePos:bytePos + 1]
-                                            bytePos += 1
-
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
-
-                                            timestamps.append(timestamp_sec)
-                                            timestamp_types.append(timestamp_type)
-                                            slot_ids.append(slot_id)
-                                            lidar_ids.append(lidar_id)
-                                            coord1s.append(coord1)
-                                            coord2s.append(coord2)
-                                            coord3s.append(coord3)
-                                            intensities.append(intensity)
-                                            returnNums.append(returnNum)
+                            timestamp_type = data_pc[8]
+                            timestamp_sec = getTimestamp(data_pc, timestamp_type, 10)
+
+                            if timeOffsets is not None:
+                                if numPackets == len(packetTimes):
+                                    pointBlocks = np.concatenate((pointBlocks, np.empty_like(pointBlocks)))
+                                    packetTimes = np.concatenate((packetTimes, np.empty_like(packetTimes)))
+
+                                pointBlocks[numPackets] = frombuffer(data_pc, dtype=pointDtype, count=numPoints, offset=_PACKET_HEADER_SIZE)
+                                packetTimes[numPackets] = timestamp_sec
+                                numPackets += 1
+
+                                # timestamp of the last point in the packet
+                                timestamp_sec += lastOffset
 
                         # duration check (exit point)
                         else:
@@ -491,95 +571,48 @@ class _dataCaptureThread(object):
                         break
 
                 # make sure some data was captured
-                lenData = len(coord1s)
+                lenData = numPackets
                 if lenData > 0:
 
                     if self._showMessages: print(
                         "   " + self.sensorIP + self._format_spaces + self._format_spaces + "   -->     writing data to ASCII file: " + self.filePathAndName)
-                    csvFile = open(self.filePathAndName, "w")
-
-                    numPts = 0
-                    nullPts = 0
+                    csvFile = open(self.filePathAndName, "w", buffering=_CSV_WRITE_BUFFER_SIZE)
 
                     # TODO: apply coordinate transformations to the raw X, Y, Z point cloud data based on the extrinsic parameters
                     # rotation definitions and the sequence they are applied is always a bit of a head scratcher, lots of different definitions
                     # Geospatial/Traditional Photogrammetry/Computer Vision/North America/Europe all use different approaches
 
-                    # single return fimware
-                    if self.firmwareType == 1:
-
-                        # Cartesian
-                        if self.dataType == 0:
-                            csvFile.write("//X,Y,Z,Inten-sity,Time\n")
-                            for i in range(0, lenData):
-                                coord1 = round(float(struct.unpack('<i', coord1s[i])[0]) / 1000.0, 3)
-                                coord2 = round(float(struct.unpack('<i', coord2s[i])[0]) / 1000.0, 3)
-                                coord3 = round(float(struct.unpack('<i', coord3s[i])[0]) / 1000.0, 3)
-                                if coord1 or coord2 or coord3:
-                                    numPts += 1
-                                    csvFile.write("{0:.3f}".format(coord1) \
-                                                  + "," + "{0:.3f}".format(coord2) \
-                                                  + "," + "{0:.3f}".format(coord3) \
-                                                  + "," + str(int.from_bytes(intensities[i], byteorder='little')) \
-                                                  + "," + "{0:.6f}".format(timestamps[i]) + "\n")
-                                else:
-                                    nullPts += 1
-
-                        # Spherical
-                        elif self.dataType == 1:
-                            csvFile.write("//Distance,Zenith,Azimuth,Inten-sity,Time\n")
-                            for i in range(0, lenData):
-                                coord1 = round(float(struct.unpack('<I', coord1s[i])[0]) / 1000.0, 3)
-                                coord2 = round(float(struct.unpack('<H', coord2s[i])[0]) / 100.0, 2)
-                                coord3 = round(float(struct.unpack('<H', coord3s[i])[0]) / 100.0, 2)
-                                if coord1:
-                                    numPts += 1
-                                    csvFile.write("{0:.3f}".format(coord1) \
-                                                  + "," + "{0:.2f}".format(coord2) \
-                                                  + "," + "{0:.2f}".format(coord3) \
-                                                  + "," + str(int.from_bytes(intensities[i], byteorder='little')) \
-                                                  + "," + "{0:.6f}".format(timestamps[i]) + "\n")
-                                else:
-                                    nullPts += 1
-
-                    # multiple returns firmware
-                    elif self.firmwareType == 2 or self.firmwareType == 3:
-
-                        # Cartesian
-                        if self.dataType == 0:
-                            csvFile.write("//X,Y,Z,Inten-sity,Time,ReturnNum\n")
-                            for i in range(0, lenData):
-                                coord1 = round(float(struct.unpack('<i', coord1s[i])[0]) / 1000.0, 3)
-                                coord2 = round(float(struct.unpack('<i', coord2s[i])[0]) / 1000.0, 3)
-                                coord3 = round(float(struct.unpack('<i', coord3s[i])[0]) / 1000.0, 3)
-                                if coord1 or coord2 or coord3:
-                                    numPts += 1
-                                    csvFile.write("{0:.3f}".format(coord1) \
-                                                  + "," + "{0:.3f}".format(coord2) \
-                                                  + "," + "{0:.3f}".format(coord3) \
-                                                  + "," + str(int.from_bytes(intensities[i], byteorder='little')) \
-                                                  + "," + "{0:.6f}".format(timestamps[i]) \
-                                                  + "," + str(returnNums[i]) + "\n")
-                                else:
-                                    nullPts += 1
-
-                        # Spherical
-                        elif self.dataType == 1:
-                            csvFile.write("//Distance,Zenith,Azimuth,Inten-sity,Time,ReturnNum\n")
-                            for i in range(0, lenData):
-                                coord1 = round(float(struct.unpack('<I', coord1s[i])[0]) / 1000.0, 3)
-                                coord2 = round(float(struct.unpack('<H', coord2s[i])[0]) / 100.0, 2)
-                                coord3 = round(float(struct.unpack('<H', coord3s[i])[0]) / 100.0, 2)
-                                if coord1:
-                                    numPts += 1
-                                    csvFile.write("{0:.3f}".format(coord1) \
-                                                  + "," + "{0:.2f}".format(coord2) \
-                                                  + "," + "{0:.2f}".format(coord3) \
-                                                  + "," + str(int.from_bytes(intensities[i], byteorder='little')) \
-                                                  + "," + "{0:.6f}".format(timestamps[i]) \
-                                                  + "," + str(returnNums[i]) + "\n")
-                                else:
-                                    nullPts += 1
+                    # decode all the captured points at once
+                    points = pointBlocks[:numPackets].ravel()
+                    timestamps = (packetTimes[:numPackets, np.newaxis] + timeOffsets).ravel()
+
+                    # Cartesian, null points have all zero coordinates
+                    if self.dataType == 0:
+                        header = "//X,Y,Z,Inten-sity,Time"
+                        rowFormat = "%.3f,%.3f,%.3f,%d,%.6f"
+                        cols = [points['x'] / 1000.0, points['y'] / 1000.0, points['z'] / 1000.0]
+                        goodPts = (points['x'] != 0) | (points['y'] != 0) | (points['z'] != 0)
+                    # Spherical, null points have a zero distance
+                    else:
+                        header = "//Distance,Zenith,Azimuth,Inten-sity,Time"
+                        rowFormat = "%.3f,%.2f,%.2f,%d,%.6f"
+                        cols = [points['distance'] / 1000.0, points['zenith'] / 100.0, points['azimuth'] / 100.0]
+                        goodPts = points['distance'] != 0
+                    cols += [points['intensity'], timestamps]
+
+                    # multiple returns firmware also includes the return number
+                    if self.firmwareType != 1:
+                        header += ",ReturnNum"
+                        rowFormat += ",%d"
+                        cols.append(np.tile(pointReturnNums, lenData))
+
+                    table = np.column_stack(cols)[goodPts]
+                    numPts = len(table)
+                    nullPts = len(points) - numPts
+
+                    csvFile.write(header + "\n")
+                    for i in range(0, numPts, _CONVERT_CHUNK_SIZE):
+                        csvFile.write(_formatCSVRows(table[i:i + _CONVERT_CHUNK_SIZE], rowFormat + "\n"))
 
                     self.numPts = numPts
                     self.nullPts = nullPts
@@ -604,17 +637,20 @@ class _dataCaptureThread(object):
         # keep looping to 'consume' data that we don't want included in the captured point cloud data
 
         breakByCapture = False
+        # packets are received into the same pre-allocated buffer (no new bytes object per packet), the captured points
+        # are copied out of it
+        pktBuffer = memoryview(bytearray(_PACKET_BUFFER_SIZE))
         while True:
 
             if self.started:
-                selectTest = select.select([self.d_socket], [], [], 0)
+                selectTest = select.select([self.d_socket], [], [], _CAPTURE_POLL_TIMEOUT)
                 if selectTest[0]:
-                    data_pc, addr = self.d_socket.recvfrom(1500)
-                    version = int.from_bytes(data_pc[0:1], byteorder='little')
-                    self.dataType = int.from_bytes(data_pc[9:10], byteorder='little')
-                    timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                    timestamp1 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                    self.updateStatus(data_pc[4:8])
+                    data_pc = pktBuffer[:self.d_socket.recv_into(pktBuffer)]
+                    version = data_pc[0]
+                    self.dataType = data_pc[9]
+                    timestamp_type = data_pc[8]
+                    timestamp1 = self.getTimestamp(data_pc, timestamp_type, 10)
+                    self.updateStatus(data_pc, 4)
                     if self.isCapturing:
                         self.startTime = timestamp1
                         breakByCapture = True
@@ -634,11 +670,11 @@ class _dataCaptureThread(object):
                         timeSinceStart = timestamp2 - self.startTime
                         if timeSinceStart <= self.secsToWait:
                             # read data from receive buffer and keep 'consuming' it
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp2 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                                self.updateStatus(data_pc[4:8])
+                            if select.select([self.d_socket], [], [], _CAPTURE_POLL_TIMEOUT)[0]:
+                                data_pc = pktBuffer[:self.d_socket.recv_into(pktBuffer)]
+                                timestamp_type = data_pc[8]
+                                timestamp2 = self.getTimestamp(data_pc, timestamp_type, 10)
+                                self.updateStatus(data_pc, 4)
                         else:
                             self.startTime = timestamp2
                             break
@@ -660,287 +696,105 @@ class _dataCaptureThread(object):
 
                 if self._showMessages: print(
                     "   " + self.sensorIP + self._format_spaces + "   -->     writing real-time data to ASCII file: " + self.filePathAndName)
-                csvFile = open(self.filePathAndName, "w", 1)
-
-                numPts = 0
-                nullPts = 0
-
-                # write header info
-                if self.firmwareType == 1:  # single return firmware
-                    if self.dataType == 0:  # Cartesian
-                        csvFile.write("//X,Y,Z,Inten-sity,Time\n")
-                    elif self.dataType == 1:  # Spherical
-                        csvFile.write("//Distance,Zenith,Azimuth,Inten-sity,Time\n")
-                elif self.firmwareType == 2 or self.firmwareType == 3:  # double or triple return firmware
-                    if self.dataType == 0:  # Cartesian
-                        csvFile.write("//X,Y,Z,Inten-sity,Time,ReturnNum\n")
-                    elif self.dataType == 1:  # Spherical
-                        csvFile.write("//Distance,Zenith,Azimuth,Inten-sity,Time,ReturnNum\n")
+                csvFile = open(self.filePathAndName, "w", buffering=_CSV_WRITE_BUFFER_SIZE)
+
+                # blocks of packets' points are handed off to a separate writer thread, so formatting and writing them
+                # doesn't hold up receiving (the writer thread sleeps in the queue until a block is handed off)
+                writeQueue = queue.Queue()
+                handOff = writeQueue.put
+                writer = None
+
+                # the point record layout, time offsets and return numbers are all selected once, rather than for each packet
+                layout = self._asciiPointLayout()
+                if layout is not None:
+                    _, timeOffsets, returnNums = layout
+                    pointDtype = _POINT_DTYPES[self.dataType]
+                    numPoints = len(timeOffsets)
+                    lastOffset = float(timeOffsets[-1])
+
+                    # write header info
+                    # Cartesian, null points have a zero Y coordinate
+                    if self.dataType == 0:
+                        header = "//X,Y,Z,Inten-sity,Time"
+                        rowFormat = "%.3f,%.3f,%.3f,%d,%.6f"
+                        coordScales = (('x', 1000.0), ('y', 1000.0), ('z', 1000.0))
+                        checkField = 'y'
+                    # Spherical, null points have a zero distance
+                    else:
+                        header = "//Distance,Zenith,Azimuth,Inten-sity,Time"
+                        rowFormat = "%.3f,%.2f,%.2f,%d,%.6f"
+                        coordScales = (('distance', 1000.0), ('zenith', 100.0), ('azimuth', 100.0))
+                        checkField = 'distance'
+
+                    # multiple returns firmware also includes the return number
+                    if self.firmwareType != 1:
+                        header += ",ReturnNum"
+                        rowFormat += ",%d"
+                    else:
+                        returnNums = None
+                    csvFile.write(header + "\n")
+                    rowFormat += "\n"
+
+                    # points and timestamp of each packet of the block currently being filled
+                    pointBlocks = np.empty((_CSV_WRITE_BATCH_PACKETS, numPoints), dtype=pointDtype)
+                    packetTimes = np.empty(_CSV_WRITE_BATCH_PACKETS)
+                    numPackets = 0
+
+                    csvLayout = (rowFormat, coordScales, checkField, timeOffsets, returnNums)
+                    writer = threading.Thread(target=self._csvWriter, args=(csvFile, writeQueue, threading.current_thread(), csvLayout))
+                    writer.daemon = True
+                    writer.start()
+
+                # resolve the methods and attributes used for every packet once, rather than on each pass of the main loop
+                poll = select.select
+                dataSockets = [self.d_socket]
+                recvInto = self.d_socket.recv_into
+                updateStatus = self.updateStatus
+                getTimestamp = self.getTimestamp
+                frombuffer = np.frombuffer
+                startTime = self.startTime
+                duration = self.duration
 
                 # main loop that captures the desired point cloud data
                 while True:
                     if self.started:
-                        timeSinceStart = timestamp_sec - self.startTime
+                        timeSinceStart = timestamp_sec - startTime
 
-                        if timeSinceStart <= self.duration:
+                        if timeSinceStart <= duration:
 
-                            # read data from receive buffer
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
+                            # read data from receive buffer, only waiting for data once it's been drained
+                            try:
+                                data_pc = pktBuffer[:recvInto(pktBuffer)]
+                            except BlockingIOError:
+                                poll(dataSockets, [], [], _CAPTURE_POLL_TIMEOUT)
+                                continue
 
-                                # version = int.from_bytes(data_pc[0:1], byteorder='little')
-                                # slot_id = int.from_bytes(data_pc[1:2], byteorder='little')
-                                # lidar_id = int.from_bytes(data_pc[2:3], byteorder='little')
+                            # version = int.from_bytes(data_pc[0:1], byteorder='little')
+                            # slot_id = int.from_bytes(data_pc[1:2], byteorder='little')
+                            # lidar_id = int.from_bytes(data_pc[2:3], byteorder='little')
 
-                                # byte 3 is reserved
+                            # byte 3 is reserved
 
-                                # update lidar status information
-                                self.updateStatus(data_pc[4:8])
-
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp_sec = self.getTimestamp(data_pc[10:18], timestamp_type)
-
-                                bytePos = 18
-
-                                # single return firmware (most common)
-                                if self.firmwareType == 1:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.00001
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if coord2:
-                                                # X coordinate
-                                                coord1 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 8
-                                                # Z coordinate
-                                                coord3 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 4
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord2) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord3) / 1000.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 13
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if coord1:
-                                                bytePos += 4
-                                                # Zenith coordinate
-                                                coord2 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # Azimuth coordinate
-                                                coord3 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.2f}".format(
-                                                        float(coord2) / 100.0) + "," + "{0:.2f}".format(
-                                                        float(coord3) / 100.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 9
-
-                                # double return firmware
-                                elif self.firmwareType == 2:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.00001
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            if coord2:
-                                                # X coordinate
-                                                coord1 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 8
-                                                # Z coordinate
-                                                coord3 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 4
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord2) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord3) / 1000.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + str(
-                                                        returnNum) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 13
-
-                                                # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            if coord1:
-                                                bytePos += 4
-                                                # Zenith coordinate
-                                                coord2 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # Azimuth coordinate
-                                                coord3 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.2f}".format(
-                                                        float(coord2) / 100.0) + "," + "{0:.2f}".format(
-                                                        float(coord3) / 100.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + str(
-                                                        returnNum) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 9
-
-
-                                # triple return firmware
-                                elif self.firmwareType == 3:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.000016666
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
-
-                                            if coord2:
-                                                # X coordinate
-                                                coord1 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 8
-                                                # Z coordinate
-                                                coord3 = struct.unpack('<i', data_pc[bytePos:bytePos + 4])[0]
-                                                bytePos += 4
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord2) / 1000.0) + "," + "{0:.3f}".format(
-                                                        float(coord3) / 1000.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + str(
-                                                        returnNum) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 13
-
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
-
-                                            if coord1:
-                                                bytePos += 4
-                                                # Zenith coordinate
-                                                coord2 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # Azimuth coordinate
-                                                coord3 = struct.unpack('<H', data_pc[bytePos:bytePos + 2])[0]
-                                                bytePos += 2
-                                                # intensity
-                                                intensity = int.from_bytes(data_pc[bytePos:bytePos + 1],
-                                                                           byteorder='little')
-                                                bytePos += 1
-
-                                                numPts += 1
-                                                csvFile.write(
-                                                    "{0:.3f}".format(float(coord1) / 1000.0) + "," + "{0:.2f}".format(
-                                                        float(coord2) / 100.0) + "," + "{0:.2f}".format(
-                                                        float(coord3) / 100.0) + "," + str(
-                                                        intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + str(
-                                                        returnNum) + "\n")
-                                            else:
-                                                nullPts += 1
-                                                bytePos += 9
+                            # update lidar status information
+                            updateStatus(data_pc, 4)
+
+                            timestamp_type = data_pc[8]
+                            timestamp_sec = getTimestamp(data_pc, timestamp_type, 10)
+
+                            if layout is not None:
+                                # copy all the points in the packet at once, no per-point parsing
+                                pointBlocks[numPackets] = frombuffer(data_pc, dtype=pointDtype, count=numPoints, offset=_PACKET_HEADER_SIZE)
+                                packetTimes[numPackets] = timestamp_sec
+                                numPackets += 1
+
+                                if numPackets == _CSV_WRITE_BATCH_PACKETS:
+                                    handOff((pointBlocks, packetTimes))
+                                    pointBlocks = np.empty_like(pointBlocks)
+                                    packetTimes = np.empty_like(packetTimes)
+                                    numPackets = 0
+
+                                # timestamp of the last point in the packet
+                                timestamp_sec += lastOffset
 
                         # duration check (exit point)
                         else:
@@ -951,8 +805,16 @@ class _dataCaptureThread(object):
                     else:
                         break
 
-                self.numPts = numPts
-                self.nullPts = nullPts
+                # let the writer thread finish writing everything that was handed off to it (it also sets the point counts),
+                # None marks the end of the capture
+                if writer is not None:
+                    if numPackets:
+                        handOff((pointBlocks[:numPackets], packetTimes[:numPackets]))
+                    handOff(None)
+                    writer.join()
+
+                numPts = self.numPts
+                nullPts = self.nullPts
 
                 if self._showMessages:
                     print("   " + self.sensorIP + self._format_spaces + "   -->     closed ASCII file: " + self.filePathAndName)
@@ -969,6 +831,9 @@ class _dataCaptureThread(object):
         # keep looping to 'consume' data that we don't want included in the captured point cloud data
 
         breakByCapture = False
+        # packets are received into the same pre-allocated buffer (no new bytes object per packet), the captured points
+        # are copied out of it
+        pktBuffer = memoryview(bytearray(_PACKET_BUFFER_SIZE))
 
         #used to check if the sensor is a Mid-100
         deviceCheck = 0
@@ -980,14 +845,14 @@ class _dataCaptureThread(object):
         while True:
 
             if self.started:
-                selectTest = select.select([self.d_socket], [], [], 0)
+                selectTest = select.select([self.d_socket], [], [], _CAPTURE_POLL_TIMEOUT)
                 if selectTest[0]:
-                    data_pc, addr = self.d_socket.recvfrom(1500)
-                    version = int.from_bytes(data_pc[0:1], byteorder='little')
-                    self.dataType = int.from_bytes(data_pc[9:10], byteorder='little')
-                    timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                    timestamp1 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                    self.updateStatus(data_pc[4:8])
+                    data_pc = pktBuffer[:self.d_socket.recv_into(pktBuffer)]
+                    version = data_pc[0]
+                    self.dataType = data_pc[9]
+                    timestamp_type = data_pc[8]
+                    timestamp1 = self.getTimestamp(data_pc, timestamp_type, 10)
+                    self.updateStatus(data_pc, 4)
                     if self.isCapturing:
                         self.startTime = timestamp1
                         breakByCapture = True
@@ -1000,20 +865,59 @@ class _dataCaptureThread(object):
             # check data packet is as expected (first byte anyways)
             if version == 5:
 
-                # delayed start to capturing data check (secsToWait parameter)
+                # the output file, writer thread and receive buffers are all set up before the delayed start (secsToWait
+                # parameter), so that the first captured packets don't have to wait on them
+                # the point data file is written through its raw file descriptor (see _writeBuffers)
+                binFd = os.open(self.filePathAndName, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                IMU_file = None
+
+                # packets' point records are handed off to a separate writer thread, so disk stalls don't hold up receiving
+                writeQueue = collections.deque()
+                receiveDone = threading.Event()
+
+                IMU_reporting = False
+                numPts = 0
+                nullPts = 0
+                imu_records = 0
+
+                # resolve the methods and attributes used for every packet once, rather than on each pass of the main loop
+                poll = select.select
+                dataSocket = self.d_socket
+                imuSocket = self.i_socket
+                captureSockets = [dataSocket, imuSocket]
+                recvInto = self.d_socket.recv_into
+                imuRecvFrom = self.i_socket.recvfrom
+                packTime = _FLOAT64_STRUCT.pack
+                updateStatus = self.updateStatus
+                getTimestamp = self.getTimestamp
+                binRecordLayout = self._binRecordLayout
+                handOff = writeQueue.append
+                frombuffer = np.frombuffer
+                duration = self.duration
+                isMid100 = deviceCheck == 100
+
+                # write header info to know how to parse the data later
+                _writeBuffers(binFd, [str.encode("OPENPYLIVOX") + struct.pack('<h', self.firmwareType) + struct.pack('<h', self.dataType)])
+
+                writer = threading.Thread(target=self._binWriter, args=(binFd, writeQueue, receiveDone, threading.current_thread()))
+                writer.daemon = True
+                writer.start()
+
+                # delayed start to capturing data check (secsToWait parameter), measured against the sensor's timestamps
                 timestamp2 = self.startTime
+                captureStart = self.startTime + self.secsToWait
                 while True:
                     if self.started:
-                        timeSinceStart = timestamp2 - self.startTime
-                        if timeSinceStart <= self.secsToWait:
-                            # read data from receive buffer and keep 'consuming' it
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp2 = self.getTimestamp(data_pc[10:18], timestamp_type)
-                                self.updateStatus(data_pc[4:8])
-                            if select.select([self.i_socket], [], [], 0)[0]:
-                                imu_data, addr2 = self.i_socket.recvfrom(50)
+                        if timestamp2 <= captureStart:
+                            # read data from receive buffers and keep 'consuming' it
+                            ready = poll(captureSockets, [], [], _CAPTURE_POLL_TIMEOUT)[0]
+                            if dataSocket in ready:
+                                data_pc = pktBuffer[:recvInto(pktBuffer)]
+                                timestamp_type = data_pc[8]
+                                timestamp2 = getTimestamp(data_pc, timestamp_type, 10)
+                                updateStatus(data_pc, 4)
+                            if imuSocket in ready:
+                                imu_data, addr2 = imuRecvFrom(50)
                         else:
                             self.startTime = timestamp2
                             break
@@ -1023,32 +927,34 @@ class _dataCaptureThread(object):
                 if self._showMessages: print("   " + self.sensorIP + self._format_spaces + "   -->     CAPTURING DATA...")
 
                 timestamp_sec = self.startTime
+                startTime = self.startTime
+
+                # single return firmware (relevant for Mid-40 and Mid-100) selects the record layout by each packet's data type
+                # Horizon and Tele-15 sensors also fall under the single return firmware
+                # multiple returns firmware (Mid-40 and Mid-100 only) uses the data type of the first packet, so its record
+                # layout is only selected once
+                fixedLayout = self.firmwareType != 1
+                if fixedLayout:
+                    layout = binRecordLayout(self.dataType, isMid100)
 
                 if self._showMessages: print(
                     "   " + self.sensorIP + self._format_spaces + "   -->     writing real-time data to BINARY file: " + self.filePathAndName)
-                binFile = open(self.filePathAndName, "wb")
-                IMU_file = None
-
-                IMU_reporting = False
-                numPts = 0
-                nullPts = 0
-                imu_records = 0
-
-                # write header info to know how to parse the data later
-                binFile.write(str.encode("OPENPYLIVOX"))
-                binFile.write(struct.pack('<h', self.firmwareType))
-                binFile.write(struct.pack('<h', self.dataType))
 
                 # main loop that captures the desired point cloud data
                 while True:
                     if self.started:
-                        timeSinceStart = timestamp_sec - self.startTime
+                        timeSinceStart = timestamp_sec - startTime
+
+                        if timeSinceStart <= duration:
 
-                        if timeSinceStart <= self.duration:
+                            # read points from data buffer, until it's been drained
+                            try:
+                                nbytes = recvInto(pktBuffer)
+                            except BlockingIOError:
+                                nbytes = None
 
-                            # read points from data buffer
-                            if select.select([self.d_socket], [], [], 0)[0]:
-                                data_pc, addr = self.d_socket.recvfrom(1500)
+                            if nbytes is not None:
+                                data_pc = pktBuffer[:nbytes]
 
                                 # version = int.from_bytes(data_pc[0:1], byteorder='little')
                                 # slot_id = int.from_bytes(data_pc[1:2], byteorder='little')
@@ -1057,308 +963,72 @@ class _dataCaptureThread(object):
                                 # byte 3 is reserved
 
                                 # update lidar status information
-                                self.updateStatus(data_pc[4:8])
-                                dataType = int.from_bytes(data_pc[9:10], byteorder='little')
-                                timestamp_type = int.from_bytes(data_pc[8:9], byteorder='little')
-                                timestamp_sec = self.getTimestamp(data_pc[10:18], timestamp_type)
-
-                                bytePos = 18
-
-                                # single return firmware (relevant for Mid-40 and Mid-100)
-                                # Horizon and Tele-15 sensors also fall under this 'if' statement
-                                if self.firmwareType == 1:
+                                updateStatus(data_pc, 4)
+                                timestamp_type = data_pc[8]
+                                timestamp_sec = getTimestamp(data_pc, timestamp_type, 10)
 
-                                    # Cartesian Coordinate System
-                                    if dataType == 0:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.00001
-
-                                        for i in range(0, 100):
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if deviceCheck == 100:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 13])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                if coord2:
-                                                    numPts += 1
-                                                    binFile.write(data_pc[bytePos:bytePos + 13])
-                                                    binFile.write(struct.pack('<d', timestamp_sec))
-                                                else:
-                                                    nullPts += 1
-
-                                            bytePos += 13
-
-                                    # Spherical Coordinate System
-                                    elif dataType == 1:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.00001
-
-                                        for i in range(0, 100):
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if coord1:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 9])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 9
-
-                                    # Horizon and Tele-15 Cartesian (single return)
-                                    elif dataType == 2:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.000004167
-                                        for i in range(0, 96):
+                                if not fixedLayout:
+                                    layout = binRecordLayout(data_pc[9], isMid100)
+                                if layout is not None:
+                                    nullCheck, recordDtype, timeOffsets, returnNums, keepNullPts = layout
 
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.000004167
-
-                                            if coord2:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 14])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 14
-
-                                    # Horizon and Tele-15 Spherical (single return)
-                                    elif dataType == 3:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.000004167
-                                        for i in range(0, 96):
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if coord1:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 10])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 10
-
-                                    # Horizon and Tele-15 Cartesian (dual return)
-                                    elif dataType == 4:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.000002083
-                                        for i in range(0, 48):
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.000002083
-
-                                            if coord2:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 28])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 28
-
-                                    # Horizon and Tele-15 Spherical (dual return)
-                                    elif dataType == 5:
-                                        # to account for first point's timestamp being increment in the loop
-                                        timestamp_sec -= 0.000002083
-                                        for i in range(0, 48):
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            # timestamp
-                                            timestamp_sec += 0.00001
-
-                                            if coord1:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 16])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 16
-
-                                # double return firmware (Mid-40 and Mid-100 only)
-                                elif self.firmwareType == 2:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.00001
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            if deviceCheck == 100:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 13])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                                binFile.write(str.encode(str(returnNum)))
-                                            else:
-                                                if coord2:
-                                                    numPts += 1
-                                                    binFile.write(data_pc[bytePos:bytePos + 13])
-                                                    binFile.write(struct.pack('<d', timestamp_sec))
-                                                    binFile.write(str.encode(str(returnNum)))
-                                                else:
-                                                    nullPts += 1
-
-                                            bytePos += 13
-
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            zeroORtwo = i % 2
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORtwo)) * 0.00001
-
-                                            # return number
-                                            returnNum += zeroORtwo * 1
-
-                                            if coord1:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 9])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                                binFile.write(str.encode(str(returnNum)))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 9
-
-                                # triple return firmware (Mid-40 and Mid-100 only)
-                                elif self.firmwareType == 3:
-                                    # to account for first point's timestamp being increment in the loop
-                                    timestamp_sec -= 0.000016667
-
-                                    # Cartesian Coordinate System
-                                    if self.dataType == 0:
-                                        for i in range(0, 100):
-                                            returnNum = 1
-
-                                            # Y coordinate (check for non-zero)
-                                            coord2 = struct.unpack('<i', data_pc[bytePos + 4:bytePos + 8])[0]
+                                    # view all the points in the packet at once, no per-point parsing
+                                    points = frombuffer(data_pc, dtype=nullCheck, count=len(timeOffsets), offset=_PACKET_HEADER_SIZE)
 
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
+                                    records = np.empty(len(points), dtype=recordDtype)
+                                    records['point'] = points.view(recordDtype['point'])
+                                    records['time'] = timestamp_sec + timeOffsets
+                                    if returnNums is not None:
+                                        records['returnNum'] = returnNums
 
-                                            if deviceCheck == 100:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 13])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                                binFile.write(str.encode(str(returnNum)))
-                                            else:
-                                                if coord2:
-                                                    numPts += 1
-                                                    binFile.write(data_pc[bytePos:bytePos + 13])
-                                                    binFile.write(struct.pack('<d', timestamp_sec))
-                                                    binFile.write(str.encode(str(returnNum)))
-                                                else:
-                                                    nullPts += 1
+                                    if not keepNullPts:
+                                        records = records[points['check'] != 0]
 
-                                            bytePos += 13
+                                    handOff(records)
+                                    numPts += len(records)
+                                    nullPts += len(points) - len(records)
 
-                                    # Spherical Coordinate System
-                                    elif self.dataType == 1:
-                                        for i in range(0, 100):
-                                            returnNum = 1
+                                    # timestamp of the last point in the packet
+                                    timestamp_sec += float(timeOffsets[-1])
 
-                                            # Distance coordinate (check for non-zero)
-                                            coord1 = struct.unpack('<I', data_pc[bytePos:bytePos + 4])[0]
-
-                                            zeroORoneORtwo = i % 3
-
-                                            # timestamp
-                                            timestamp_sec += float(not (zeroORoneORtwo)) * 0.000016666
-
-                                            # return number
-                                            returnNum += zeroORoneORtwo * 1
-
-                                            if coord1:
-                                                numPts += 1
-                                                binFile.write(data_pc[bytePos:bytePos + 9])
-                                                binFile.write(struct.pack('<d', timestamp_sec))
-                                                binFile.write(str.encode(str(returnNum)))
-                                            else:
-                                                nullPts += 1
-
-                                            bytePos += 9
+                                continue
 
                             #IMU data capture
-                            if select.select([self.i_socket], [], [], 0)[0]:
-                                imu_data, addr2 = self.i_socket.recvfrom(50)
+                            try:
+                                imu_data, addr2 = imuRecvFrom(50)
+                            except BlockingIOError:
+                                # both receive buffers have been drained, wait for point or IMU data
+                                poll(captureSockets, [], [], _CAPTURE_POLL_TIMEOUT)
+                                continue
 
-                                # version = int.from_bytes(imu_data[0:1], byteorder='little')
-                                # slot_id = int.from_bytes(imu_data[1:2], byteorder='little')
-                                # lidar_id = int.from_bytes(imu_data[2:3], byteorder='little')
+                            # version = int.from_bytes(imu_data[0:1], byteorder='little')
+                            # slot_id = int.from_bytes(imu_data[1:2], byteorder='little')
+                            # lidar_id = int.from_bytes(imu_data[2:3], byteorder='little')
 
-                                # byte 3 is reserved
+                            # byte 3 is reserved
 
-                                # update lidar status information
-                                # self.updateStatus(imu_data[4:8])
+                            # update lidar status information
+                            # self.updateStatus(imu_data, 4)
 
-                                dataType = int.from_bytes(imu_data[9:10], byteorder='little')
-                                timestamp_type = int.from_bytes(imu_data[8:9], byteorder='little')
-                                timestamp_sec = self.getTimestamp(imu_data[10:18], timestamp_type)
+                            dataType = imu_data[9]
+                            timestamp_type = imu_data[8]
+                            timestamp_sec = getTimestamp(imu_data, timestamp_type, 10)
 
-                                bytePos = 18
+                            bytePos = 18
 
-                                # Horizon and Tele-15 IMU data packet
-                                if dataType == 6:
-                                    if not IMU_reporting:
-                                        IMU_reporting = True
-                                        path_file = Path(self.filePathAndName)
-                                        filename = path_file.stem
-                                        exten = path_file.suffix
-                                        IMU_file = open(filename + "_IMU" + exten, "wb")
-                                        IMU_file.write(str.encode("OPENPYLIVOX_IMU"))
+                            # Horizon and Tele-15 IMU data packet
+                            if dataType == 6:
+                                if not IMU_reporting:
+                                    IMU_reporting = True
+                                    path_file = Path(self.filePathAndName)
+                                    filename = path_file.stem
+                                    exten = path_file.suffix
+                                    IMU_file = open(filename + "_IMU" + exten, "wb", buffering=_BIN_WRITE_BUFFER_SIZE)
+                                    IMU_file.write(str.encode("OPENPYLIVOX_IMU"))
 
-                                    IMU_file.write(imu_data[bytePos:bytePos + 24])
-                                    IMU_file.write(struct.pack('<d', timestamp_sec))
-                                    imu_records += 1
+                                IMU_file.write(imu_data[bytePos:bytePos + 24])
+                                IMU_file.write(packTime(timestamp_sec))
+                                imu_records += 1
 
                         # duration check (exit point)
                         else:
@@ -1369,6 +1039,10 @@ class _dataCaptureThread(object):
                     else:
                         break
 
+                # let the writer thread finish writing everything that was handed off to it
+                receiveDone.set()
+                writer.join()
+
                 self.numPts = numPts
                 self.nullPts = nullPts
                 self.imu_records = imu_records
@@ -1379,7 +1053,7 @@ class _dataCaptureThread(object):
                     if self._deviceType == "Horizon" or self._deviceType == "Tele-15":
                         print("                                (IMU records: " + str(imu_records) + ")")
 
-                binFile.close()
+                os.close(binFd)
 
                 if IMU_reporting:
                     IMU_file.close()
@@ -1387,19 +1061,158 @@ class _dataCaptureThread(object):
             else:
                 if self._showMessages: print("   " + self.sensorIP + self._format_spaces + "   -->     Incorrect packet version")
 
-    def getTimestamp(self, data_pc, timestamp_type):
+    # writer thread of the real-time ASCII capture, formats and writes the blocks of packets' points handed off by the
+    # capturing thread until capturing is done (or the capturing thread has died) and everything handed off has been written
+    def _csvWriter(self, csvFile, writeQueue, receiver, csvLayout):
+
+        rowFormat, coordScales, checkField, timeOffsets, returnNums = csvLayout
+        numCols = len(coordScales) + 2
+        if returnNums is not None:
+            # return numbers of a full block's points (a partial block's points are the leading ones)
+            returnNums = np.tile(returnNums, _CSV_WRITE_BATCH_PACKETS)
+            numCols += 1
+
+        get = writeQueue.get
+        numPts = 0
+        nullPts = 0
+        while True:
+            try:
+                block = get(timeout=_CAPTURE_POLL_TIMEOUT)
+            except queue.Empty:
+                if not receiver.is_alive():
+                    break
+                continue
+
+            # end of the capture
+            if block is None:
+                break
+
+            pointBlocks, packetTimes = block
+            points = pointBlocks.ravel()
+            goodPts = points[checkField] != 0
+            goodPoints = points[goodPts]
+
+            # only the good points are converted, straight into their columns of the table (no intermediate column
+            # arrays to stack)
+            rows = np.empty((len(goodPoints), numCols))
+            for col, (name, scale) in enumerate(coordScales):
+                np.divide(goodPoints[name], scale, out=rows[:, col])
+            rows[:, 3] = goodPoints['intensity']
+            rows[:, 4] = (packetTimes[:, np.newaxis] + timeOffsets).ravel()[goodPts]
+            if returnNums is not None:
+                rows[:, 5] = returnNums[:len(points)][goodPts]
+
+            # each block is flushed, so the file keeps up with the capture
+            csvFile.write(_formatCSVRows(rows, rowFormat))
+            csvFile.flush()
+            numPts += len(rows)
+            nullPts += len(points) - len(rows)
+
+        self.numPts = numPts
+        self.nullPts = nullPts
+
+    # writer thread of the real-time binary capture, writes the point records handed off by the capturing thread in
+    # batches until capturing is done (or the capturing thread has died) and everything handed off has been written
+    def _binWriter(self, binFd, writeQueue, receiveDone, receiver):
+
+        popleft = writeQueue.popleft
+        batch = []
+        while True:
+            try:
+                while len(batch) < _BIN_WRITE_BATCH_PACKETS:
+                    batch.append(popleft())
+            except IndexError:
+                if not batch:
+                    if (receiveDone.is_set() or not receiver.is_alive()) and not writeQueue:
+                        break
+                    receiveDone.wait(_BIN_WRITE_IDLE_WAIT)
+                    continue
+
+            _writeBuffers(binFd, [records.view(np.uint8) for records in batch])
+            batch.clear()
+
+    # numpy layout used to store the points of a data packet as OPL binary records (point bytes, time, [return #]),
+    # built once per firmware type and data type combination (None if the combination is not stored)
+    def _binRecordLayout(self, dataType, isMid100):
+
+        key = (self.firmwareType, dataType, isMid100)
+        if key in self._binLayouts:
+            return self._binLayouts[key]
+
+        numReturns = 0
+        firstShift, spacing = 0., 0.
+
+        # single return firmware (relevant for all sensors)
+        if self.firmwareType == 1 and dataType in _SINGLE_RETURN_TIMING:
+            numReturns = 1
+            firstShift, spacing = _SINGLE_RETURN_TIMING[dataType]
+        # double return firmware (Mid-40 and Mid-100 only)
+        elif self.firmwareType == 2 and (dataType == 0 or dataType == 1):
+            numReturns = 2
+            firstShift, spacing = 0.00001, 0.00001
+        # triple return firmware (Mid-40 and Mid-100 only)
+        elif self.firmwareType == 3 and (dataType == 0 or dataType == 1):
+            numReturns = 3
+            firstShift, spacing = 0.000016667, 0.000016666
+
+        layout = None
+        if numReturns:
+            pointSize = _POINT_DTYPES[dataType].itemsize
+            pointIndex = np.arange(_POINTS_PER_PACKET[dataType])
+
+            # null points have a zero Y coordinate (Cartesian) or zero leading 4 bytes (Spherical)
+            if dataType == 0 or dataType == 2 or dataType == 4:
+                nullCheck = np.dtype({'names': ['check'], 'formats': ['<i4'], 'offsets': [4], 'itemsize': pointSize})
+            else:
+                nullCheck = np.dtype({'names': ['check'], 'formats': ['<u4'], 'offsets': [0], 'itemsize': pointSize})
+
+            # time of each point relative to the packet's timestamp (multiple returns of a pulse share the same time)
+            timeOffsets = (pointIndex // numReturns + 1) * spacing - firstShift
+
+            fields = [('point', 'V' + str(pointSize)), ('time', '<f8')]
+            returnNums = None
+            if numReturns > 1:
+                # return number is stored as a single ASCII character
+                fields.append(('returnNum', 'S1'))
+                returnNums = (pointIndex % numReturns + 1).astype('S1')
+
+            # Mid-100 Cartesian data keeps its null points
+            keepNullPts = isMid100 and dataType == 0
+
+            layout = (nullCheck, np.dtype(fields), timeOffsets, returnNums, keepNullPts)
+
+        self._binLayouts[key] = layout
+        return layout
+
+    # size (bytes) of a data packet's point records, and the time of each point relative to the packet's timestamp and its
+    # return number (multiple returns of a pulse share the same time) of the ASCII captures (None if not supported, the
+    # ASCII captures only support Mid-40/100 data types)
+    def _asciiPointLayout(self):
+
+        if self.firmwareType not in _ASCII_PULSE_SPACING or (self.dataType != 0 and self.dataType != 1):
+            return None
+
+        numReturns = self.firmwareType
+        pointIndex = np.arange(_POINTS_PER_PACKET[self.dataType])
+        timeOffsets = (pointIndex // numReturns) * _ASCII_PULSE_SPACING[self.firmwareType]
+        returnNums = pointIndex % numReturns + 1
+
+        return len(pointIndex) * _POINT_DTYPES[self.dataType].itemsize, timeOffsets, returnNums
+
+    # the timestamp starts at the offset (bytes) within data_pc, e.g., 10 within a data packet
+    def getTimestamp(self, data_pc, timestamp_type, offset=0):
 
         # nanosecond timestamp
         if timestamp_type == 0 or timestamp_type == 1 or timestamp_type == 4:
-            timestamp_sec = round(float(struct.unpack('<Q', data_pc[0:8])[0]) / 1000000000.0, 6)  # convert to seconds
+            timestamp_sec = round(float(_UINT64_STRUCT.unpack_from(data_pc, offset)[0]) / 1000000000.0, 6)  # convert to seconds
 
         # UTC timestamp, microseconds past the hour
         elif timestamp_type == 3:
-            timestamp_year = int.from_bytes(data_pc[0:1], byteorder='little')
-            timestamp_month = int.from_bytes(data_pc[1:2], byteorder='little')
-            timestamp_day = int.from_bytes(data_pc[2:3], byteorder='little')
-            timestamp_hour = int.from_bytes(data_pc[3:4], byteorder='little')
-            timestamp_sec = round(float(struct.unpack('<L', data_pc[4:8])[0]) / 1000000.0, 6)  # convert to seconds
+            timestamp_year = data_pc[offset]
+            timestamp_month = data_pc[offset + 1]
+            timestamp_day = data_pc[offset + 2]
+            timestamp_hour = data_pc[offset + 3]
+            timestamp_sec = round(float(_UINT32_STRUCT.unpack_from(data_pc, offset + 4)[0]) / 1000000.0, 6)  # convert to seconds
 
             timestamp_sec += timestamp_hour * 3600.  # seconds into the day
 
@@ -1408,25 +1221,29 @@ class _dataCaptureThread(object):
         return timestamp_sec
 
     # parse lidar status codes and update object properties, can provide real-time warning/error message display
-    def updateStatus(self, data_pc):
-
-        status_bits = str(bin(int.from_bytes(data_pc[0:1], byteorder='little')))[2:].zfill(8)
-        status_bits += str(bin(int.from_bytes(data_pc[1:2], byteorder='little')))[2:].zfill(8)
-        status_bits += str(bin(int.from_bytes(data_pc[2:3], byteorder='little')))[2:].zfill(8)
-        status_bits += str(bin(int.from_bytes(data_pc[3:4], byteorder='little')))[2:].zfill(8)
-
-        self.temp_status = int(status_bits[0:2], 2)
-        self.volt_status = int(status_bits[2:4], 2)
-        self.motor_status = int(status_bits[4:6], 2)
-        self.dirty_status = int(status_bits[6:8], 2)
-        self.firmware_status = int(status_bits[8:9], 2)
-        self.pps_status = int(status_bits[9:10], 2)
-        self.device_status = int(status_bits[10:11], 2)
-        self.fan_status = int(status_bits[11:12], 2)
-        self.self_heating_status = int(status_bits[12:13], 2)
-        self.ptp_status = int(status_bits[13:14], 2)
-        self.time_sync_status = int(status_bits[14:16], 2)
-        self.system_status = int(status_bits[30:], 2)
+    # the 4 status code bytes start at the offset (bytes) within data_pc, e.g., 4 within a data packet
+    def updateStatus(self, data_pc, offset=0):
+
+        # the status codes are read from the most significant bits of each byte first
+        status_code = _UINT32_STRUCT.unpack_from(data_pc, offset)[0]
+
+        # nearly every data packet repeats the previous packet's status codes, there's nothing to update (or report) then
+        if status_code == self._statusCode:
+            return
+        self._statusCode = status_code
+
+        self.temp_status = (status_code >> 6) & 3
+        self.volt_status = (status_code >> 4) & 3
+        self.motor_status = (status_code >> 2) & 3
+        self.dirty_status = status_code & 3
+        self.firmware_status = (status_code >> 15) & 1
+        self.pps_status = (status_code >> 14) & 1
+        self.device_status = (status_code >> 13) & 1
+        self.fan_status = (status_code >> 12) & 1
+        self.self_heating_status = (status_code >> 11) & 1
+        self.ptp_status = (status_code >> 10) & 1
+        self.time_sync_status = (status_code >> 8) & 3
+        self.system_status = (status_code >> 24) & 3
 
         # check if the system status in NOT normal
         if self.system_status:
@@ -1469,34 +1286,34 @@ class _dataCaptureThread(object):
 
 class openpylivox(object):
 
-    _CMD_QUERY =                  bytes.fromhex((b'AA010F0000000004D70002AE8A8A7B').decode('ascii'))
-    _CMD_HEARTBEAT =              bytes.fromhex((b'AA010F0000000004D7000338BA8D0C').decode('ascii'))
-    _CMD_DISCONNECT =             bytes.fromhex((b'AA010F0000000004D70006B74EE77C').decode('ascii'))
-    _CMD_READ_EXTRINSIC =         bytes.fromhex((b'AA010F0000000004D70102EFBB9162').decode('ascii'))
-    _CMD_GET_FAN =                bytes.fromhex((b'AA010F0000000004D701054C2EF5FC').decode('ascii'))
-    _CMD_GET_IMU =                bytes.fromhex((b'AA010F0000000004D70109676243F5').decode('ascii'))
-
-    _CMD_RAIN_FOG_ON =            bytes.fromhex((b'AA011000000000B809010301D271D049').decode('ascii'))
-    _CMD_RAIN_FOG_OFF =           bytes.fromhex((b'AA011000000000B8090103004441D73E').decode('ascii'))
-    _CMD_LIDAR_START =            bytes.fromhex((b'AA011000000000B8090100011122FD62').decode('ascii'))
-    _CMD_LIDAR_POWERSAVE =        bytes.fromhex((b'AA011000000000B809010002AB73F4FB').decode('ascii'))
-    _CMD_LIDAR_STANDBY =          bytes.fromhex((b'AA011000000000B8090100033D43F38C').decode('ascii'))
-    _CMD_DATA_STOP =              bytes.fromhex((b'AA011000000000B809000400B4BD5470').decode('ascii'))
-    _CMD_DATA_START =             bytes.fromhex((b'AA011000000000B809000401228D5307').decode('ascii'))
-    _CMD_CARTESIAN_CS =           bytes.fromhex((b'AA011000000000B809000500F58C4F69').decode('ascii'))
-    _CMD_SPHERICAL_CS =           bytes.fromhex((b'AA011000000000B80900050163BC481E').decode('ascii'))
-    _CMD_FAN_ON =                 bytes.fromhex((b'AA011000000000B80901040115E79106').decode('ascii'))
-    _CMD_FAN_OFF =                bytes.fromhex((b'AA011000000000B80901040083D79671').decode('ascii'))
-    _CMD_LIDAR_SINGLE_1ST =       bytes.fromhex((b'AA011000000000B80901060001B5A043').decode('ascii'))
-    _CMD_LIDAR_SINGLE_STRONGEST = bytes.fromhex((b'AA011000000000B8090106019785A734').decode('ascii'))
-    _CMD_LIDAR_DUAL =             bytes.fromhex((b'AA011000000000B8090106022DD4AEAD').decode('ascii'))
-    _CMD_IMU_DATA_ON =            bytes.fromhex((b'AA011000000000B80901080119A824AA').decode('ascii'))
-    _CMD_IMU_DATA_OFF =           bytes.fromhex((b'AA011000000000B8090108008F9823DD').decode('ascii'))
-
-    _CMD_REBOOT =                 bytes.fromhex((b'AA011100000000FC02000A000004477736').decode('ascii'))
-
-    _CMD_DYNAMIC_IP =             bytes.fromhex((b'AA011400000000A8240008000000000068F8DD50').decode('ascii'))
-    _CMD_WRITE_ZERO_EO =          bytes.fromhex((b'AA012700000000B5ED01010000000000000000000000000000000000000000000000004CDEA4E7').decode('ascii'))
+    _CMD_QUERY =                  bytes.fromhex('AA010F0000000004D70002AE8A8A7B')
+    _CMD_HEARTBEAT =              bytes.fromhex('AA010F0000000004D7000338BA8D0C')
+    _CMD_DISCONNECT =             bytes.fromhex('AA010F0000000004D70006B74EE77C')
+    _CMD_READ_EXTRINSIC =         bytes.fromhex('AA010F0000000004D70102EFBB9162')
+    _CMD_GET_FAN =                bytes.fromhex('AA010F0000000004D701054C2EF5FC')
+    _CMD_GET_IMU =                bytes.fromhex('AA010F0000000004D70109676243F5')
+
+    _CMD_RAIN_FOG_ON =            bytes.fromhex('AA011000000000B809010301D271D049')
+    _CMD_RAIN_FOG_OFF =           bytes.fromhex('AA011000000000B8090103004441D73E')
+    _CMD_LIDAR_START =            bytes.fromhex('AA011000000000B8090100011122FD62')
+    _CMD_LIDAR_POWERSAVE =        bytes.fromhex('AA011000000000B809010002AB73F4FB')
+    _CMD_LIDAR_STANDBY =          bytes.fromhex('AA011000000000B8090100033D43F38C')
+    _CMD_DATA_STOP =              bytes.fromhex('AA011000000000B809000400B4BD5470')
+    _CMD_DATA_START =             bytes.fromhex('AA011000000000B809000401228D5307')
+    _CMD_CARTESIAN_CS =           bytes.fromhex('AA011000000000B809000500F58C4F69')
+    _CMD_SPHERICAL_CS =           bytes.fromhex('AA011000000000B80900050163BC481E')
+    _CMD_FAN_ON =                 bytes.fromhex('AA011000000000B80901040115E79106')
+    _CMD_FAN_OFF =                bytes.fromhex('AA011000000000B80901040083D79671')
+    _CMD_LIDAR_SINGLE_1ST =       bytes.fromhex('AA011000000000B80901060001B5A043')
+    _CMD_LIDAR_SINGLE_STRONGEST = bytes.fromhex('AA011000000000B8090106019785A734')
+    _CMD_LIDAR_DUAL =             bytes.fromhex('AA011000000000B8090106022DD4AEAD')
+    _CMD_IMU_DATA_ON =            bytes.fromhex('AA011000000000B80901080119A824AA')
+    _CMD_IMU_DATA_OFF =           bytes.fromhex('AA011000000000B8090108008F9823DD')
+
+    _CMD_REBOOT =                 bytes.fromhex('AA011100000000FC02000A000004477736')
+
+    _CMD_DYNAMIC_IP =             bytes.fromhex('AA011400000000A8240008000000000068F8DD50')
+    _CMD_WRITE_ZERO_EO =          bytes.fromhex('AA012700000000B5ED01010000000000000000000000000000000000000000000000004CDEA4E7')
 
     _SPECIAL_FIRMWARE_TYPE_DICT = {"03.03.0001": 2,
                                    "03.03.0002": 3,
@@ -1543,6 +1360,12 @@ class openpylivox(object):
         self._cmdSocket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self._imuSocket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+        # the OS may silently cap the receive buffer (e.g., Linux caps it at net.core.rmem_max, which can be raised with
+        # 'sysctl -w net.core.rmem_max=16777216'), in which case data packets are more likely to be dropped
+        rcvBufSize = _enlargeReceiveBuffer(self._dataSocket, _DATA_SOCKET_RCVBUF)
+        if rcvBufSize < _DATA_SOCKET_RCVBUF and self._showMessages:
+            print("   " + self._sensorIP + self._format_spaces + "   -->     WARNING: data receive buffer limited to " + str(rcvBufSize) + " bytes by the OS")
+
         lidarSensorIPs, serialNums, ipRangeCodes, sensorTypes = self._searchForSensors(False)
 
         unique_serialNums = []
@@ -1727,7 +1550,8 @@ class openpylivox(object):
 
     def _waitForIdle(self):
 
-        while self._heartbeat.idle_state != 9:
+        # (a heartbeat stopped by a sensor error never goes idle again)
+        while self._heartbeat.idle_state != 9 and not self._heartbeat.error_event.is_set():
             time.sleep(0.1)
 
     def _disconnectSensor(self):
@@ -1821,6 +1645,12 @@ class openpylivox(object):
 
     def _parseResp(self, binData):
 
+        return openpylivox._parseRespPacket(binData, self._showMessages)
+
+    # static, so that responses can be parsed without an openpylivox object (e.g., by the heartbeat thread)
+    @staticmethod
+    def _parseRespPacket(binData, showMessages=False):
+
         dataBytes = []
         dataString = ""
         dataLength = len(binData)
@@ -1833,7 +1663,7 @@ class openpylivox(object):
             crc16Data += binascii.hexlify(dataBytes[i])
 
         crc16DataA = bytes.fromhex((crc16Data).decode('ascii'))
-        checkSum16I = self._crc16(crc16DataA)
+        checkSum16I = openpylivox._crc16(crc16DataA)
 
         frame_header_checksum_crc16 = int.from_bytes((dataBytes[7] + dataBytes[8]), byteorder='little')
 
@@ -1849,7 +1679,7 @@ class openpylivox(object):
                 crc32Data += binascii.hexlify(dataBytes[i])
 
             crc32DataA = bytes.fromhex((crc32Data).decode('ascii'))
-            checkSum32I = self._crc32(crc32DataA)
+            checkSum32I = openpylivox._crc32(crc32DataA)
 
             frame_header_checksum_crc32 = int.from_bytes((dataBytes[dataLength - 4] + dataBytes[dataLength - 3] +
                                                           dataBytes[dataLength - 2] + dataBytes[dataLength - 1]),
@@ -1899,61 +1729,25 @@ class openpylivox(object):
                     goodData = False
             else:
                 goodData = False
-                if self._showMessages: print("CRC32 Checksum Error")
+                if showMessages: print("CRC32 Checksum Error")
         else:
             goodData = False
-            if self._showMessages: print("CRC16 Checksum Error")
+            if showMessages: print("CRC16 Checksum Error")
 
         return goodData, cmdMessage, dataMessage, dataID, data
 
-    def _crc16(self, data):
+    @staticmethod
+    def _crc16(data):
 
-        crc16 = crcmod.mkCrcFun(0x11021, rev=True, initCrc=0x4C49)
-        checkSum = crc16(data)
+        checkSum = _CRC16(data)
         return checkSum
 
-    def _crc16fromStr(self, binString):
+    @staticmethod
+    def _crc32(data):
 
-        crcDataA = bytes.fromhex((binString).decode('ascii'))
-        checkSum = self._crc16(crcDataA)
-        strHexCheckSum = str(hex(checkSum))[2:]
-
-        strLen = len(strHexCheckSum)
-        for i in range(strLen, 4):
-            strHexCheckSum = "0" + strHexCheckSum
-
-        byte1 = strHexCheckSum[2:4]
-        byte2 = strHexCheckSum[0:2]
-
-        checkSumB = (byte1 + byte2)
-
-        return checkSumB
-
-    def _crc32(self, data):
-
-        crc32 = crcmod.mkCrcFun(0x104C11DB7, rev=True, initCrc=0x564F580A, xorOut=0xFFFFFFFF)
-        checkSum = crc32(data)
+        checkSum = _CRC32(data)
         return checkSum
 
-    def _crc32fromStr(self, binString):
-
-        crcDataA = bytes.fromhex((binString).decode('ascii'))
-        checkSum = self._crc32(crcDataA)
-        strHexCheckSum = str(hex(checkSum))[2:]
-
-        strLen = len(strHexCheckSum)
-        for i in range(strLen, 8):
-            strHexCheckSum = "0" + strHexCheckSum
-
-        byte1 = strHexCheckSum[6:8]
-        byte2 = strHexCheckSum[4:6]
-        byte3 = strHexCheckSum[2:4]
-        byte4 = strHexCheckSum[0:2]
-
-        checkSumB = (byte1 + byte2 + byte3 + byte4)
-
-        return checkSumB
-
     def discover(self, manualComputerIP=""):
 
         if not manualComputerIP:
@@ -2058,24 +1852,12 @@ class openpylivox(object):
 
                 self._dataPort, self._cmdPort, self._imuPort = self._bindPorts()
 
+                # handshake: computer IP, then the data, command and IMU ports
                 IP_parts = self._computerIP.split(".")
-                IPhex = str(hex(int(IP_parts[0]))).replace('0x', '').zfill(2)
-                IPhex += str(hex(int(IP_parts[1]))).replace('0x', '').zfill(2)
-                IPhex += str(hex(int(IP_parts[2]))).replace('0x', '').zfill(2)
-                IPhex += str(hex(int(IP_parts[3]))).replace('0x', '').zfill(2)
-                dataHexAll = str(hex(int(self._dataPort))).replace('0x', '').zfill(4)
-                dataHex = dataHexAll[2:] + dataHexAll[:-2]
-                cmdHexAll = str(hex(int(self._cmdPort))).replace('0x', '').zfill(4)
-                cmdHex = cmdHexAll[2:] + cmdHexAll[:-2]
-                imuHexAll = str(hex(int(self._imuPort))).replace('0x', '').zfill(4)
-                imuHex = imuHexAll[2:] + imuHexAll[:-2]
-                cmdString = "AA011900000000DC580001" + IPhex + dataHex + cmdHex + imuHex
-                binString = bytes(cmdString, encoding='utf-8')
-                crc32checksum = self._crc32fromStr(binString)
-                cmdString += crc32checksum
-                binString = bytes(cmdString, encoding='utf-8')
-
-                connect_request = bytes.fromhex((binString).decode('ascii'))
+                handshake = bytes(int(IP_part) for IP_part in IP_parts)
+                handshake += struct.pack('<HHH', int(self._dataPort), int(self._cmdPort), int(self._imuPort))
+
+                connect_request = _livoxCommand(0x00, 0x01, handshake)
                 self._cmdSocket.sendto(connect_request, (self._sensorIP, 65000))
 
                 # check for proper response from connection request
@@ -2326,9 +2108,15 @@ class openpylivox(object):
             time.sleep(0.1)
             states = []
             states.append(self._heartbeat.work_state)
+            heartbeatError = self._heartbeat.error_event.is_set()
 
             for i in range(len(self._mid100_sensors)):
                 states.append(self._mid100_sensors[i]._heartbeat.work_state)
+                heartbeatError = heartbeatError or self._mid100_sensors[i]._heartbeat.error_event.is_set()
+
+            # the sensor reported an error, it won't become ready
+            if heartbeatError:
+                break
 
             stopper = False
             for i in range(len(states)):
@@ -2595,19 +2383,10 @@ class openpylivox(object):
             ipAddress = self._checkIP(ipAddress)
             if ipAddress:
                 IP_parts = ipAddress.split(".")
-                IPhex1 = str(hex(int(IP_parts[0]))).replace('0x', '').zfill(2)
-                IPhex2 = str(hex(int(IP_parts[1]))).replace('0x', '').zfill(2)
-                IPhex3 = str(hex(int(IP_parts[2]))).replace('0x', '').zfill(2)
-                IPhex4 = str(hex(int(IP_parts[3]))).replace('0x', '').zfill(2)
                 formattedIP = IP_parts[0].strip() + "." + IP_parts[1].strip() + "." + IP_parts[2].strip() + "." + \
                               IP_parts[3].strip()
-                cmdString = "AA011400000000a824000801" + IPhex1 + IPhex2 + IPhex3 + IPhex4
-                binString = bytes(cmdString, encoding='utf-8')
-                crc32checksum = self._crc32fromStr(binString)
-                cmdString += crc32checksum
-                binString = bytes(cmdString, encoding='utf-8')
-
-                staticIP_request = bytes.fromhex((binString).decode('ascii'))
+                # IP mode 1 = static IP, then the IP address
+                staticIP_request = _livoxCommand(0x00, 0x08, bytes((1, int(IP_parts[0]), int(IP_parts[1]), int(IP_parts[2]), int(IP_parts[3]))))
                 self._waitForIdle()
                 self._cmdSocket.sendto(staticIP_request, (self._sensorIP, 65000))
 
@@ -2778,19 +2557,7 @@ class openpylivox(object):
                     "*** Error - one or more of the extrinsic values specified are not of the correct type ***")
 
             if goodValues:
-                h_x = str(binascii.hexlify(struct.pack('<i', xi)))[2:-1]
-                h_y = str(binascii.hexlify(struct.pack('<i', yi)))[2:-1]
-                h_z = str(binascii.hexlify(struct.pack('<i', zi)))[2:-1]
-                h_roll = str(binascii.hexlify(struct.pack('<f', rollf)))[2:-1]
-                h_pitch = str(binascii.hexlify(struct.pack('<f', pitchf)))[2:-1]
-                h_yaw = str(binascii.hexlify(struct.pack('<f', yawf)))[2:-1]
-
-                cmdString = "AA012700000000b5ed0101" + h_roll + h_pitch + h_yaw + h_x + h_y + h_z
-                binString = bytes(cmdString, encoding='utf-8')
-                crc32checksum = self._crc32fromStr(binString)
-                cmdString += crc32checksum
-                binString = bytes(cmdString, encoding='utf-8')
-                setExtValues = bytes.fromhex((binString).decode('ascii'))
+                setExtValues = _livoxCommand(0x01, 0x01, struct.pack('<fffiii', rollf, pitchf, yawf, xi, yi, zi))
 
                 self._waitForIdle()
                 self._cmdSocket.sendto(setExtValues, (self._sensorIP, 65000))
@@ -2838,19 +2605,8 @@ class openpylivox(object):
             if seci < 0 or seci > int(60 * 60 * 1000000):
                 seci = 0
 
-            year_b = str(binascii.hexlify(struct.pack('<B', yeari)))[2:-1]
-            month_b = str(binascii.hexlify(struct.pack('<B', monthi)))[2:-1]
-            day_b = str(binascii.hexlify(struct.pack('<B', dayi)))[2:-1]
-            hour_b = str(binascii.hexlify(struct.pack('<B', houri)))[2:-1]
-            sec_b = str(binascii.hexlify(struct.pack('<I', seci)))[2:-1]
-
             # test case Sept 10, 2020 at 17:15 UTC  -->  AA0117000000006439010A14090A1100E9A435D0337994
-            cmdString = "AA0117000000006439010A" + year_b + month_b + day_b + hour_b + sec_b
-            binString = bytes(cmdString, encoding='utf-8')
-            crc32checksum = self._crc32fromStr(binString)
-            cmdString += crc32checksum
-            binString = bytes(cmdString, encoding='utf-8')
-            setUTCValues = bytes.fromhex((binString).decode('ascii'))
+            setUTCValues = _livoxCommand(0x01, 0x0A, struct.pack('<BBBBI', yeari, monthi, dayi, houri, seci))
 
             self._waitForIdle()
             self._cmdSocket.sendto(setUTCValues, (self._sensorIP, 65000))
@@ -3061,6 +2817,91 @@ class openpylivox(object):
         else:
             if self._showMessages: print("Not connected to Livox sensor at IP: " + self._sensorIP)
 
+    # command packet, expected ACK (command set, command ID), and request/value descriptions of a command that can be
+    # sent as part of a batch (see batchCommands)
+    def _batchCommand(self, name, *args):
+
+        if name == "setCartesianCS":
+            return self._CMD_CARTESIAN_CS, "General", "5", "change to Cartesian coordinates", "Cartesian coordinate output"
+        elif name == "setSphericalCS":
+            return self._CMD_SPHERICAL_CS, "General", "5", "change to Spherical coordinates", "Spherical coordinate output"
+        elif name == "setRainFogSuppression":
+            if args[0]:
+                return self._CMD_RAIN_FOG_ON, "Lidar", "3", "turn on rain/fog suppression", "rain/fog suppression value"
+            return self._CMD_RAIN_FOG_OFF, "Lidar", "3", "turn off rain/fog suppression", "rain/fog suppression value"
+        elif name == "setFan":
+            if args[0]:
+                return self._CMD_FAN_ON, "Lidar", "4", "turn on fan", "fan value"
+            return self._CMD_FAN_OFF, "Lidar", "4", "turn off fan", "fan value"
+        elif name == "setLidarReturnMode":
+            if args[0] == 0:
+                return self._CMD_LIDAR_SINGLE_1ST, "Lidar", "6", "single first return lidar mode", "lidar mode value"
+            elif args[0] == 1:
+                return self._CMD_LIDAR_SINGLE_STRONGEST, "Lidar", "6", "single strongest return lidar mode", "lidar mode value"
+            elif args[0] == 2:
+                return self._CMD_LIDAR_DUAL, "Lidar", "6", "dual return lidar mode", "lidar mode value"
+        elif name == "setIMUdataPush":
+            if args[0]:
+                return self._CMD_IMU_DATA_ON, "Lidar", "8", "start IMU data push", "IMU data push value"
+            return self._CMD_IMU_DATA_OFF, "Lidar", "8", "stop IMU data push", "IMU data push value"
+
+        return None
+
+    def _batchCommands(self, commands):
+
+        if self._isConnected:
+            self._waitForIdle()
+
+            # send all the requests back-to-back, then collect their responses (instead of a round trip per request)
+            pending = []
+            for command in commands:
+                batchCommand = self._batchCommand(*command)
+                if batchCommand is None:
+                    if self._showMessages: print("   " + self._sensorIP + self._format_spaces + "   -->     unknown batch command: " + str(command))
+                    continue
+
+                self._cmdSocket.sendto(batchCommand[0], (self._sensorIP, 65000))
+                if self._showMessages: print("   " + self._sensorIP + self._format_spaces + "   <--     sent " + batchCommand[3] + " request")
+                pending.append((command[0], batchCommand))
+
+            # responses are matched to their requests by the command set and command ID of the ACK
+            while pending and select.select([self._cmdSocket], [], [], 0.1)[0]:
+                binData, addr = self._cmdSocket.recvfrom(16)
+                _, ack, cmd_set, cmd_id, ret_code_bin = self._parseResp(binData)
+
+                for i in range(len(pending)):
+                    name, batchCommand = pending[i]
+                    if ack == "ACK (response)" and cmd_set == batchCommand[1] and cmd_id == batchCommand[2]:
+                        ret_code = int.from_bytes(ret_code_bin[0], byteorder='little')
+                        if ret_code == 1:
+                            if self._showMessages: print(
+                                "   " + self._sensorIP + self._format_spaces + "   -->     FAILED to set " + batchCommand[4])
+                        elif ret_code == 0:
+                            if name == "setCartesianCS":
+                                self._coordSystem = 0
+                            elif name == "setSphericalCS":
+                                self._coordSystem = 1
+                        del pending[i]
+                        break
+                else:
+                    if self._showMessages: print(
+                        "   " + self._sensorIP + self._format_spaces + "   -->     incorrect batch command response")
+        else:
+            if self._showMessages: print("Not connected to Livox sensor at IP: " + self._sensorIP)
+
+    # sends several settings commands to the sensor at once, each command is given as a tuple of the name of the
+    # equivalent openpylivox method followed by its arguments, e.g. [("setCartesianCS",), ("setLidarReturnMode", 0)]
+    # supported: setCartesianCS, setSphericalCS, setRainFogSuppression, setFan, setLidarReturnMode, setIMUdataPush
+    def batchCommands(self, commands):
+        self._batchCommands(commands)
+        # like the individual methods, only the coordinate system, rain/fog suppression and fan commands are also sent to
+        # the other sensors of a Mid-100
+        mid100Commands = [command for command in commands
+                          if command[0] in ("setCartesianCS", "setSphericalCS", "setRainFogSuppression", "setFan")]
+        if mid100Commands:
+            for i in range(len(self._mid100_sensors)):
+                self._mid100_sensors[i]._batchCommands(mid100Commands)
+
 
     @deprecated(version='1.0.2', reason="You should use saveDataToFile instead")
     def saveDataToCSV(self, filePathAndName, secsToWait, duration):
@@ -3394,35 +3235,78 @@ class openpylivox(object):
 
                 return [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1]
 
-    def _doneCapturing(self):
-        # small sleep to ensure this command isn't continuously called if in a while True loop
-        time.sleep(0.01)
+    def _doneCapturing(self, timeout=0.01):
+        # waits on the capture thread's completion event (up to timeout seconds, or indefinitely if None),
+        # so this command doesn't spin the CPU if continuously called in a while True loop
         if self._captureStream is not None:
             if self._captureStream.duration != 126230400:
-                return not (self._captureStream.started)
+                return self._captureStream.captureDone.wait(timeout)
             else:
                 return True
         else:
             return True
 
-    def doneCapturing(self):
-        stop = []
-        stop.append(self._doneCapturing())
-        for i in range(len(self._mid100_sensors)):
-            stop.append(self._mid100_sensors[i]._doneCapturing())
+    def doneCapturing(self, timeout=0.01):
+        return _waitForCaptures([self] + self._mid100_sensors, timeout)
 
-        return all(stop)
+def _waitForCaptures(sensors, timeout):
+    # the timeout is shared by all the sensors, not applied to each sensor in turn
+    deadline = None
+    if timeout is not None:
+        deadline = time.time() + timeout
 
-def allDoneCapturing(sensors):
     stop = []
-    for i in range(0, len(sensors)):
-        if sensors[i]._captureStream is not None:
-            stop.append(sensors[i].doneCapturing())
+    for sensor in sensors:
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.time())
+        stop.append(sensor._doneCapturing(remaining))
 
-    # small sleep to ensure this command isn't continuously called if in a while True loop
-    time.sleep(0.01)
     return all(stop)
 
+def allDoneCapturing(sensors, timeout=0.01):
+    capturing = []
+    for sensor in sensors:
+        if sensor._captureStream is not None:
+            capturing.append(sensor)
+            capturing.extend(sensor._mid100_sensors)
+
+    return _waitForCaptures(capturing, timeout)
+
+
+# converts the OPL binary IMU data file of an OPL binary point data file to CSV (if it exists), a chunk of records at a
+# time (see _oplRecordChunks)
+def _convertIMUBin2CSV(filePathAndName, deleteBin):
+    path_file = Path(filePathAndName)
+    filename = path_file.stem
+    exten = path_file.suffix
+    IMU_file = filename + "_IMU" + exten
+
+    if os.path.exists(IMU_file) and os.path.isfile(IMU_file):
+        bin_size2 = Path(IMU_file).stat().st_size - 15
+        num_recs = int(bin_size2/32)
+        binFile2 = open(IMU_file, "rb")
+
+        checkMessage = (binFile2.read(15)).decode('UTF-8')
+        if checkMessage == "OPENPYLIVOX_IMU":
+            with open(IMU_file + ".csv", "w", buffering=_CSV_WRITE_BUFFER_SIZE) as csvFile2:
+                csvFile2.write("//gyro_x,gyro_y,gyro_z,acc_x,acc_y,acc_z,time\n")
+                pbari2 = tqdm(total=num_recs, unit=" records", desc="   ")
+                for records in _oplRecordChunks(IMU_file, _IMU_RECORD_DTYPE, num_recs):
+                    csvFile2.write(_formatCSVRows(np.column_stack([records[name] for name in _IMU_RECORD_DTYPE.names]),
+                                                  _IMU_CSV_ROW_FORMAT))
+                    pbari2.update(len(records))
+
+                pbari2.close()
+                binFile2.close()
+                print("   - IMU data was converted successfully to CSV, see file: " + IMU_file + ".csv")
+                if deleteBin:
+                    os.remove(IMU_file)
+                    print("     * OPL IMU data binary file has been deleted")
+        else:
+            print("*** ERROR: The file was not recognized as an OpenPyLivox binary IMU data file ***")
+            binFile2.close()
+
 
 def _convertBin2CSV(filePathAndName, deleteBin):
 
@@ -3439,7 +3323,7 @@ def _convertBin2CSV(filePathAndName, deleteBin):
 
             checkMessage = (binFile.read(11)).decode('UTF-8')
             if checkMessage == "OPENPYLIVOX":
-                with open(filePathAndName + ".csv", "w", 1) as csvFile:
+                with open(filePathAndName + ".csv", "w", buffering=_CSV_WRITE_BUFFER_SIZE) as csvFile:
                     firmwareType = struct.unpack('<h', binFile.read(2))[0]
                     dataType = struct.unpack('<h', binFile.read(2))[0]
                     divisor = 1
@@ -3483,152 +3367,11 @@ def _convertBin2CSV(filePathAndName, deleteBin):
                             num_recs = int(bin_size / divisor)
                             pbari = tqdm(total=num_recs, unit=" pts", desc="   ")
 
-                            while True:
-                                try:
-                                    #Mid-40/100 Cartesian single return
-                                    if dataClass == 1:
-                                        coord1 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord3 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        intensity = int.from_bytes(binFile.read(1), byteorder='little')
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.3f}".format(
-                                            coord2) + "," + "{0:.3f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + ",1\n")
-
-                                    # Mid-40/100 Spherical single return
-                                    elif dataClass == 2:
-                                        coord1 = float(struct.unpack('<I', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        coord3 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        intensity = int.from_bytes(binFile.read(1), byteorder='little')
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.2f}".format(
-                                            coord2) + "," + "{0:.2f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + ",1\n")
-
-                                    # Mid-40/100 Cartesian multiple return
-                                    elif dataClass == 3:
-                                        coord1 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord3 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        intensity = int.from_bytes(binFile.read(1), byteorder='little')
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        returnNum = (binFile.read(1)).decode('UTF-8')
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.3f}".format(
-                                            coord2) + "," + "{0:.3f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + returnNum + "\n")
-
-                                    # Mid-40/100 Spherical multiple return
-                                    elif dataClass == 4:
-                                        coord1 = float(struct.unpack('<I', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        coord3 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        intensity = int.from_bytes(binFile.read(1), byteorder='little')
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        returnNum = (binFile.read(1)).decode('UTF-8')
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.2f}".format(
-                                            coord2) + "," + "{0:.2f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + "," + returnNum + "\n")
-
-                                    # Horizon/Tele-15 Cartesian single return (SDK Data Type 2)
-                                    elif dataClass == 5:
-                                        coord1 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord3 = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        intensity = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bits = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_conf = str(int(tag_bits[0:2], 2))
-                                        intensity_conf = str(int(tag_bits[2:4], 2))
-                                        returnType = str(int(tag_bits[4:6], 2))
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.3f}".format(
-                                            coord2) + "," + "{0:.3f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + ",1," + returnType + ","
-                                            + spatial_conf + "," + intensity_conf + "\n")
-
-                                    # Horizon/Tele-15 Spherical single return (SDK Data Type 3)
-                                    elif dataClass == 6:
-                                        coord1 = float(struct.unpack('<I', binFile.read(4))[0]) / 1000.0
-                                        coord2 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        coord3 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        intensity = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bits = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_conf = str(int(tag_bits[0:2], 2))
-                                        intensity_conf = str(int(tag_bits[2:4], 2))
-                                        returnType = str(int(tag_bits[4:6], 2))
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                        csvFile.write("{0:.3f}".format(coord1) + "," + "{0:.2f}".format(
-                                            coord2) + "," + "{0:.2f}".format(coord3) + "," + str(
-                                            intensity) + "," + "{0:.6f}".format(timestamp_sec) + ",1," + returnType + ","
-                                                      + spatial_conf + "," + intensity_conf + "\n")
-
-                                    # Horizon/Tele-15 Cartesian dual return (SDK Data Type 4)
-                                    elif dataClass == 7:
-                                        coord1a = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord2a = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord3a = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        intensitya = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bitsa = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_confa = str(int(tag_bitsa[0:2], 2))
-                                        intensity_confa = str(int(tag_bitsa[2:4], 2))
-                                        returnTypea = str(int(tag_bitsa[4:6], 2))
-
-                                        coord1b = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord2b = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        coord3b = float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0
-                                        intensityb = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bitsb = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_confb = str(int(tag_bitsb[0:2], 2))
-                                        intensity_confb = str(int(tag_bitsb[2:4], 2))
-                                        returnTypeb = str(int(tag_bitsb[4:6], 2))
-
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-
-                                        csvFile.write("{0:.3f}".format(coord1a) + "," + "{0:.3f}".format(
-                                            coord2a) + "," + "{0:.3f}".format(coord3a) + "," + str(
-                                            intensitya) + "," + "{0:.6f}".format(timestamp_sec) + ",1," + returnTypea + ","
-                                                      + spatial_confa + "," + intensity_confa + "\n")
-
-                                        csvFile.write("{0:.3f}".format(coord1b) + "," + "{0:.3f}".format(
-                                            coord2b) + "," + "{0:.3f}".format(coord3b) + "," + str(
-                                            intensityb) + "," + "{0:.6f}".format(timestamp_sec) + ",2," + returnTypeb + ","
-                                                      + spatial_confb + "," + intensity_confb + "\n")
-
-                                    # Horizon/Tele-15 Spherical dual return (SDK Data Type 5)
-                                    elif dataClass == 8:
-                                        coord2 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        coord3 = float(struct.unpack('<H', binFile.read(2))[0]) / 100.0
-                                        coord1a = float(struct.unpack('<I', binFile.read(4))[0]) / 1000.0
-                                        intensitya = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bitsa = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_confa = str(int(tag_bitsa[0:2], 2))
-                                        intensity_confa = str(int(tag_bitsa[2:4], 2))
-                                        returnTypea = str(int(tag_bitsa[4:6], 2))
-
-                                        coord1b = float(struct.unpack('<I', binFile.read(4))[0]) / 1000.0
-                                        intensityb = struct.unpack('<B', binFile.read(1))[0]
-                                        tag_bitsb = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                        spatial_confb = str(int(tag_bitsb[0:2], 2))
-                                        intensity_confb = str(int(tag_bitsb[2:4], 2))
-                                        returnTypeb = str(int(tag_bitsb[4:6], 2))
-
-                                        timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-
-                                        csvFile.write("{0:.3f}".format(coord1a) + "," + "{0:.2f}".format(
-                                            coord2) + "," + "{0:.2f}".format(coord3) + "," + str(
-                                            intensitya) + "," + "{0:.6f}".format(timestamp_sec) + ",1," + returnTypea + ","
-                                                      + spatial_confa + "," + intensity_confa + "\n")
-
-                                        csvFile.write("{0:.3f}".format(coord1b) + "," + "{0:.2f}".format(
-                                            coord2) + "," + "{0:.2f}".format(coord3) + "," + str(
-                                            intensityb) + "," + "{0:.6f}".format(timestamp_sec) + ",2," + returnTypeb + ","
-                                                      + spatial_confb + "," + intensity_confb + "\n")
-
-                                    pbari.update(1)
-
-                                except:
-                                    break
+                            if dataClass != 0:
+                                csvFormat = _oplCSVFormat(dataClass)
+                                for records in _oplRecordChunks(filePathAndName, _oplRecordDtype(firmwareType, dataType), num_recs):
+                                    csvFile.write(_formatCSVRows(_oplCSVColumns(records, dataClass), csvFormat))
+                                    pbari.update(len(records))
 
                             pbari.close()
                             binFile.close()
@@ -3646,48 +3389,7 @@ def _convertBin2CSV(filePathAndName, deleteBin):
                         binFile.close()
 
                 # check for and convert IMU BIN data (if it exists)
-                path_file = Path(filePathAndName)
-                filename = path_file.stem
-                exten = path_file.suffix
-                IMU_file = filename + "_IMU" + exten
-
-                if os.path.exists(IMU_file) and os.path.isfile(IMU_file):
-                    bin_size2 = Path(IMU_file).stat().st_size - 15
-                    num_recs = int(bin_size2/32)
-                    binFile2 = open(IMU_file, "rb")
-
-                    checkMessage = (binFile2.read(15)).decode('UTF-8')
-                    if checkMessage == "OPENPYLIVOX_IMU":
-                        with open(IMU_file + ".csv", "w", 1) as csvFile2:
-                            csvFile2.write("//gyro_x,gyro_y,gyro_z,acc_x,acc_y,acc_z,time\n")
-                            pbari2 = tqdm(total=num_recs, unit=" records", desc="   ")
-                            while True:
-                                try:
-                                    gyro_x = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    gyro_y = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    gyro_z = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_x = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_y = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_z = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    timestamp_sec = "{0:.6f}".format(struct.unpack('<d', binFile2.read(8))[0])
-
-                                    csvFile2.write(gyro_x + "," + gyro_y + "," + gyro_z + "," + acc_x + "," + acc_y +
-                                        "," + acc_z + "," + timestamp_sec + "\n")
-
-                                    pbari2.update(1)
-
-                                except:
-                                    break
-
-                            pbari2.close()
-                            binFile2.close()
-                            print("   - IMU data was converted successfully to CSV, see file: " + IMU_file + ".csv")
-                            if deleteBin:
-                                os.remove(IMU_file)
-                                print("     * OPL IMU data binary file has been deleted")
-                    else:
-                        print("*** ERROR: The file was not recognized as an OpenPyLivox binary IMU data file ***")
-                        binFile2.close()
+                _convertIMUBin2CSV(filePathAndName, deleteBin)
             else:
                 print("*** ERROR: The file was not recognized as an OpenPyLivox binary point data file ***")
                 binFile.close()
@@ -3730,89 +3432,85 @@ def _convertBin2LAS(filePathAndName, deleteBin):
                 divisor = 1
 
                 if firmwareType >= 1 and firmwareType <= 3:
-                    #LAS file creation only works with Cartesian data types (decided not to convert spherical obs.)
-                    if dataType == 0 or dataType == 2 or dataType == 4:
+                    if dataType >= 0 and dataType <= 5:
                         print("CONVERTING OPL BINARY DATA, PLEASE WAIT...")
 
-                        coord1s = []
-                        coord2s = []
-                        coord3s = []
-                        intensity = []
-                        times = []
-                        returnNums = []
-
                         if firmwareType == 1 and dataType == 0:
                             dataClass = 1
                             divisor = 21
+                        elif firmwareType == 1 and dataType == 1:
+                            dataClass = 2
+                            divisor = 17
                         elif firmwareType > 1 and dataType == 0:
                             dataClass = 3
                             divisor = 22
+                        elif firmwareType > 1 and dataType == 1:
+                            dataClass = 4
+                            divisor = 18
                         elif firmwareType == 1 and dataType == 2:
                             dataClass = 5
                             divisor = 22
+                        elif firmwareType == 1 and dataType == 3:
+                            dataClass = 6
+                            divisor = 18
                         elif firmwareType == 1 and dataType == 4:
                             dataClass = 7
                             divisor = 36
+                        elif firmwareType == 1 and dataType == 5:
+                            dataClass = 8
+                            divisor = 24
 
                         num_recs = int(bin_size / divisor)
                         pbari = tqdm(total=num_recs, unit=" pts", desc="   ")
 
-                        while True:
-                            try:
-                                #Mid-40/100 Cartesian single return
-                                if dataClass == 1:
-                                    coord1s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord2s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord3s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    intensity.append(int.from_bytes(binFile.read(1), byteorder='little'))
-                                    times.append(float(struct.unpack('<d', binFile.read(8))[0]))
-                                    returnNums.append(1)
-
-                                # Mid-40/100 Cartesian multiple return
-                                elif dataClass == 3:
-                                    coord1s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord2s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord3s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    intensity.append(int.from_bytes(binFile.read(1), byteorder='little'))
-                                    times.append(float(struct.unpack('<d', binFile.read(8))[0]))
-                                    returnNums.append(int((binFile.read(1)).decode('UTF-8')))
-
-                                # Horizon/Tele-15 Cartesian single return (SDK Data Type 2)
-                                elif dataClass == 5:
-                                    coord1s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord2s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord3s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    intensity.append(struct.unpack('<B', binFile.read(1))[0])
-                                    tag_bits = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                    times.append(float(struct.unpack('<d', binFile.read(8))[0]))
-                                    returnNums.append(1)
-
-                                # Horizon/Tele-15 Cartesian dual return (SDK Data Type 4)
-                                elif dataClass == 7:
-                                    coord1s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord2s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord3s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    intensity.append(struct.unpack('<B', binFile.read(1))[0])
-                                    tag_bits = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                    returnNums.append(1)
-
-                                    coord1s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord2s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    coord3s.append(float(struct.unpack('<i', binFile.read(4))[0]) / 1000.0)
-                                    intensity.append(struct.unpack('<B', binFile.read(1))[0])
-                                    tag_bits = str(bin(int.from_bytes(binFile.read(1), byteorder='little')))[2:].zfill(8)
-                                    returnNums.append(2)
-
-                                    timestamp_sec = float(struct.unpack('<d', binFile.read(8))[0])
-                                    times.append(timestamp_sec)
-                                    times.append(timestamp_sec)
-
-                                pbari.update(1)
-
-                            except:
-                                break
-
-                        #save lists of point data attributes to LAS file
+                        # Cartesian coordinates (odd data classes) are stored directly, spherical observations are converted
+                        def cartesianCoords(records, suffix):
+                            if dataClass % 2 == 1:
+                                return [(records[axis + suffix] / 1000.0).astype(np.float32) for axis in ('x', 'y', 'z')]
+                            return _sphericalToCartesian(records['distance' + suffix], records['zenith'], records['azimuth'])
+
+                        # Horizon/Tele-15 dual return records hold two points, both returns share the record's timestamp
+                        numReturns = 1
+                        if dataClass == 7 or dataClass == 8:
+                            numReturns = 2
+
+                        # the point attribute arrays are filled block by block as the binary file is read, so that only
+                        # the final LAS point attributes (and not the binary records or temporaries) are held in memory
+                        numPoints = num_recs * numReturns
+                        coord1s = np.empty(numPoints, dtype=np.float32)
+                        coord2s = np.empty(numPoints, dtype=np.float32)
+                        coord3s = np.empty(numPoints, dtype=np.float32)
+                        intensity = np.empty(numPoints, dtype=np.int16)
+                        times = np.empty(numPoints, dtype=np.float32)
+                        returnNums = np.ones(numPoints, dtype=np.int8)
+
+                        pos = 0
+                        for records in _oplRecordChunks(filePathAndName, _oplRecordDtype(firmwareType, dataType), num_recs):
+                            block = slice(pos, pos + len(records) * numReturns, numReturns)
+                            coord1s[block], coord2s[block], coord3s[block] = cartesianCoords(records, "")
+                            intensity[block] = records['intensity']
+                            times[block] = records['time']
+                            if dataClass == 3 or dataClass == 4:
+                                returnNums[block] = records['returnNum'].astype(np.int8)
+
+                            if numReturns == 2:
+                                block = slice(pos + 1, pos + len(records) * numReturns, numReturns)
+                                coord1s[block], coord2s[block], coord3s[block] = cartesianCoords(records, "2")
+                                intensity[block] = records['intensity2']
+                                times[block] = records['time']
+                                returnNums[block] = 2
+
+                            pos += len(records) * numReturns
+                            pbari.update(len(records))
+
+                        coord1s = coord1s[:pos]
+                        coord2s = coord2s[:pos]
+                        coord3s = coord3s[:pos]
+                        intensity = intensity[:pos]
+                        times = times[:pos]
+                        returnNums = returnNums[:pos]
+
+                        #save arrays of point data attributes to LAS file
                         hdr = laspy.header.Header()
                         hdr.version = "1.2"
                         hdr.data_format_id = 3
@@ -3836,10 +3534,6 @@ def _convertBin2LAS(filePathAndName, deleteBin):
 
                         lasfile = laspy.file.File(filePathAndName + ".las", mode="w", header=hdr)
 
-                        coord1s = np.asarray(coord1s, dtype=np.float32)
-                        coord2s = np.asarray(coord2s, dtype=np.float32)
-                        coord3s = np.asarray(coord3s, dtype=np.float32)
-
                         xmin = np.floor(np.min(coord1s))
                         ymin = np.floor(np.min(coord2s))
                         zmin = np.floor(np.min(coord3s))
@@ -3865,55 +3559,14 @@ def _convertBin2LAS(filePathAndName, deleteBin):
                         print()
                         time.sleep(0.5)
                     else:
-                        print("*** ERROR: Only Cartesian point data can be converted to an LAS file ***")
+                        print("*** ERROR: The OPL point data binary file reported a wrong data type ***")
                         binFile.close()
                 else:
                     print("*** ERROR: The OPL point data binary file reported a wrong firmware type ***")
                     binFile.close()
 
                 # check for and convert IMU BIN data (if it exists)
-                path_file = Path(filePathAndName)
-                filename = path_file.stem
-                exten = path_file.suffix
-                IMU_file = filename + "_IMU" + exten
-
-                if os.path.exists(IMU_file) and os.path.isfile(IMU_file):
-                    bin_size2 = Path(IMU_file).stat().st_size - 15
-                    num_recs = int(bin_size2/32)
-                    binFile2 = open(IMU_file, "rb")
-
-                    checkMessage = (binFile2.read(15)).decode('UTF-8')
-                    if checkMessage == "OPENPYLIVOX_IMU":
-                        with open(IMU_file + ".csv", "w", 1) as csvFile2:
-                            csvFile2.write("//gyro_x,gyro_y,gyro_z,acc_x,acc_y,acc_z,time\n")
-                            pbari2 = tqdm(total=num_recs, unit=" records", desc="   ")
-                            while True:
-                                try:
-                                    gyro_x = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    gyro_y = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    gyro_z = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_x = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_y = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    acc_z = "{0:.6f}".format(struct.unpack('<f', binFile2.read(4))[0])
-                                    timestamp_sec = "{0:.6f}".format(struct.unpack('<d', binFile2.read(8))[0])
-
-                                    csvFile2.write(gyro_x + "," + gyro_y + "," + gyro_z + "," + acc_x + "," + acc_y +
-                                        "," + acc_z + "," + timestamp_sec + "\n")
-
-                                    pbari2.update(1)
-
-                                except:
-                                    break
-
-                            pbari2.close()
-                            binFile2.close()
-                            print("   - IMU data was converted successfully to CSV, see file: " + IMU_file + ".csv")
-                            if deleteBin:
-                                os.remove(IMU_file)
-                                print("     * OPL IMU data binary file has been deleted")
-                    else:
-                        print("*** ERROR: The file was not recognized as an OpenPyLivox binary IMU data file ***")
-                        binFile2.close()
+                _convertIMUBin2CSV(filePathAndName, deleteBin)
             else:
                 print("*** ERROR: The file was not recognized as an OpenPyLivox binary point data file ***")
                 binFile.close()